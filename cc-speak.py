@@ -22,6 +22,8 @@ Real-time mode:
 
 import argparse
 import asyncio
+import codecs
+import heapq
 import os
 import re
 import shutil
@@ -31,10 +33,84 @@ import tempfile
 import time
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import edge_tts
+    _EDGE_COMMUNICATE = edge_tts.Communicate
+except ImportError:
+    _EDGE_COMMUNICATE = None
+
+try:
+    from watchdog.observers import Observer as _WatchdogObserver
+except ImportError:
+    _WatchdogObserver = None
+
+try:
+    import re2 as _re2  # optional: pip install google-re2
+except ImportError:
+    _re2 = None
+
 # ─── Text Cleaning ────────────────────────────────────────────────────────────
 
+# Python's \s, \d and \w are Unicode-aware while RE2's are ASCII-only, so they
+# are spelled out before handing a pattern to RE2
+_RE2_CLASS_BODIES = {
+    "s": r"\t-\r\x{1c}-\x{20}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}",
+    "d": r"\p{Nd}",
+    "w": r"\p{L}\p{N}_",
+}
+
+
+def _to_re2_syntax(pattern: str) -> str:
+    """Rewrite a `re` pattern so RE2 matches the same text.
+
+    Raises ValueError for constructs that can't be translated exactly.
+    """
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            esc = pattern[i + 1]
+            body = _RE2_CLASS_BODIES.get(esc.lower())
+            if esc in "bB" or (body is not None and in_class and esc.isupper()):
+                raise ValueError(f"no exact RE2 equivalent for \\{esc}")
+            if body is None:
+                out.append(pattern[i:i + 2])
+            elif in_class:
+                out.append(body)
+            else:
+                out.append(("[^{}]" if esc.isupper() else "[{}]").format(body))
+            i += 2
+            continue
+        if c == "[" and not in_class:
+            in_class = True
+        elif c == "]" and in_class:
+            in_class = False
+        out.append(c)
+        i += 1
+    return "".join(out)
+
+
+def _compile_linear(pattern: str, flags: int = 0):
+    """Compile with RE2 (linear-time DFA) when installed, else with `re`.
+
+    Only used for patterns where RE2 measured faster: its Python binding has
+    a per-match overhead, so patterns that match very often stay on `re`.
+    """
+    if _re2 is not None:
+        inline = "".join(f for f, bit in (("i", re.IGNORECASE), ("m", re.MULTILINE), ("s", re.DOTALL))
+                         if flags & bit)
+        try:
+            return _re2.compile((f"(?{inline})" if inline else "") + _to_re2_syntax(pattern))
+        except (ValueError, _re2.error):
+            pass
+    return re.compile(pattern, flags)
+
+
 # ANSI escape sequences (colors, cursor moves, etc.)
 RE_ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]|\x1b\].*?\x07|\x1b[()][AB012]|\x1b\[[\d;]*m")
 
@@ -45,31 +121,40 @@ RE_BOX = re.compile(r"[─━│┃┌┐└┘├┤┬┴┼╭╮╰╯╔╗
 RE_SPINNER = re.compile(r"[⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏⣷⣯⣟⡿⢿⣻⣽⣾✻◐◑◒◓⏳⌛🔄]")
 
 # Diff markers at line start
-RE_DIFF = re.compile(r"^[+\-]{1,3}(?=\s)", re.MULTILINE)
+_DIFF_MARKER = r"[+\-]{1,3}(?=\s)"
 
 # Lines that are purely decorative (only special chars and whitespace)
-RE_DECORATIVE_LINE = re.compile(r"^[\s─━═╌╍┈┉•·…\-_~*#=+|<>\/\\]+$", re.MULTILINE)
+_DECORATIVE_BODY = r"[\s─━═╌╍┈┉•·…\-_~*#=+|<>\/\\]+$"
 
 # Tool use / XML-like tags from Claude output
 RE_TOOL_TAGS = re.compile(r"</?(?:tool|artifact|function|parameter|result|content|antml)[^>]*>")
 
 # File paths that look like absolute paths (common in Claude Code output)
-RE_FILE_PATH = re.compile(r"(?:^|\s)(?:[A-Za-z]:)?(?:[/\\][\w.\-]+){2,}(?:\:\d+)?", re.MULTILINE)
+_FILE_PATH_BODY = r"(?:[A-Za-z]:)?(?:[/\\][\w.\-]+){2,}(?:\:\d+)?"
 
 # Windows paths
-RE_WIN_PATH = re.compile(r"(?:^|\s)[A-Za-z]:\\(?:[\w.\-]+\\?)+", re.MULTILINE)
+_WIN_PATH_BODY = r"[A-Za-z]:\\(?:[\w.\-]+\\?)+"
+
+# Either kind of path in one pass, Windows first as when run separately. The
+# shared "(?:^|\s)" prefix is factored out (plain alternation is slower). A
+# Windows path may run straight into a file path: the separate passes removed
+# both, since the space left by the first sub satisfied the second's prefix.
+RE_ANY_PATH = _compile_linear(
+    r"(?:^|\s)(?:" + _WIN_PATH_BODY + r"(?:" + _FILE_PATH_BODY + r")?|" + _FILE_PATH_BODY + r")",
+    re.MULTILINE,
+)
 
 # Repeated blank lines
 RE_MULTI_BLANK = re.compile(r"\n{3,}")
 
 # Progress percentage patterns
-RE_PROGRESS = re.compile(r"\d+%\s*[|█▓▒░\-=>#\[\]]+")
+RE_PROGRESS = _compile_linear(r"\d+%\s*[|█▓▒░\-=>#\[\]]+")
 
 # Token/cost lines
 RE_TOKENS = re.compile(r"^\s*[\d,.]+\s*(?:tokens?|tok)\b.*$", re.MULTILINE | re.IGNORECASE)
 
 # Duration/timing lines from Claude Code
-RE_TIMING = re.compile(r"^\s*(?:✻\s*)?(?:Worked|Completed|Duration|Elapsed)\s+(?:for\s+)?\d+.*$", re.MULTILINE | re.IGNORECASE)
+RE_TIMING = _compile_linear(r"^\s*(?:✻\s*)?(?:Worked|Completed|Duration|Elapsed)\s+(?:for\s+)?\d+.*$", re.MULTILINE | re.IGNORECASE)
 
 # Tool invocation lines (Read, Write, Bash, etc.)
 RE_TOOL_INVOKE = re.compile(r"^\s*(?:Read|Write|Edit|Bash|Glob|Grep|Task|TodoWrite)\s*\(.*\)\s*$", re.MULTILINE)
@@ -77,13 +162,19 @@ RE_TOOL_INVOKE = re.compile(r"^\s*(?:Read|Write|Edit|Bash|Glob|Grep|Task|TodoWri
 # Cost/token summary patterns
 RE_COST = re.compile(r"^\s*(?:Cost|Tokens?|Input|Output|Cache)[\s:]+[\d$.,]+.*$", re.MULTILINE | re.IGNORECASE)
 
+# Decorative lines and diff markers in one pass, with the shared "^" factored
+# out (a plain alternation of the two is slower than separate passes in `re`).
+# Removing a diff marker never changes whether a line is decorative, so the
+# result matches running the two separately.
+RE_LINE_DECORATION = re.compile(r"^(?:" + _DECORATIVE_BODY + r"|" + _DIFF_MARKER + r")", re.MULTILINE)
+
 # ─── Code Block & Tool Call Filtering ─────────────────────────────────────────
 
 # Fenced code blocks (``` ... ```)
 RE_FENCED_CODE = re.compile(r"```[^\n]*\n.*?```", re.DOTALL)
 
 # Indented code blocks (4+ spaces, 3+ consecutive lines)
-RE_INDENTED_CODE = re.compile(r"(?:^[ \t]{4,}\S.*\n){3,}", re.MULTILINE)
+RE_INDENTED_CODE = _compile_linear(r"(?:^[ \t]{4,}\S.*\n){3,}", re.MULTILINE)
 
 # JSON blocks (tool call outputs) — objects/arrays spanning multiple lines
 RE_JSON_BLOCK = re.compile(r"^\s*[\[{][\s\S]*?[\]}]\s*$", re.MULTILINE)
@@ -95,16 +186,121 @@ RE_TOOL_OUTPUT_SECTION = re.compile(
 )
 
 # Standalone URLs (http/https/ftp)
-RE_STANDALONE_URL = re.compile(r"(?:^|\s)(?:https?|ftp)://\S+", re.MULTILINE)
+RE_STANDALONE_URL = _compile_linear(r"(?:^|\s)(?:https?|ftp)://\S+", re.MULTILINE)
 
 # File path lines (lines that are primarily a file path with optional line numbers)
-RE_PATH_LINE = re.compile(
+RE_PATH_LINE = _compile_linear(
     r"^\s*(?:[A-Za-z]:)?(?:[/\\][\w.\-]+){2,}(?::\d+(?::\d+)?)?\s*$", re.MULTILINE
 )
 
 # Command output patterns ($ command ... or > command ...)
 RE_COMMAND_OUTPUT = re.compile(r"^\s*[$>]\s+\S+.*$", re.MULTILINE)
 
+# ─── Markdown & Symbol Cleanup ────────────────────────────────────────────────
+
+# Inline backtick code (`code`)
+RE_INLINE_CODE = re.compile(r"`([^`]+)`")
+
+# Markdown links [text](url)
+RE_MD_LINK = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+
+# Markdown images ![alt](url)
+RE_MD_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]+\)")
+
+# Markdown bold/italic: **text**, *text*, __text__, _text_
+RE_MD_EMPHASIS = re.compile(r"\*{1,3}([^*]+)\*{1,3}")
+RE_MD_UNDERSCORE_EMPHASIS = re.compile(r"_{1,3}(\S[^_]*\S)_{1,3}")
+
+# Markdown headers (# Header)
+RE_MD_HEADER = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+
+# Markdown horizontal rules (---, ***, ___)
+RE_MD_RULE = re.compile(r"^[\-*_]{3,}\s*$", re.MULTILINE)
+
+# Markdown bullet points (- item, * item, + item)
+RE_MD_BULLET = re.compile(r"^[\s]*[-*+]\s+", re.MULTILINE)
+
+# Numbered lists (1. item, 2) item)
+RE_MD_NUMBERED = re.compile(r"^[\s]*\d+[.)]\s+", re.MULTILINE)
+
+# HTML tags
+RE_HTML_TAG = re.compile(r"<[^>]+>")
+
+# Inline URLs
+RE_URL = re.compile(r"https?://\S+")
+
+# Multi-char arrows/entities and their spoken form
+_SYMBOL_PAIRS = {
+    "=>": " to ",
+    "->": " to ",
+    ">>": " ",
+    "<<": " ",
+    "&amp;": " and ",
+}
+RE_SYMBOL_PAIR = re.compile("|".join(re.escape(k) for k in _SYMBOL_PAIRS))
+
+
+def _symbol_pair_word(match):
+    return _SYMBOL_PAIRS[match.group(0)]
+
+
+# Single-char arrows/symbols and their spoken form (one str.translate pass)
+_SYMBOL_WORDS = str.maketrans({
+    "\u2192": " to ",
+    "\u2190": " from ",
+    "&": " and ",
+    "|": " or ",
+    "@": " at ",
+    "~": " ",
+})
+
+# snake_case identifiers (dunder names like __init__ are left alone)
+RE_SNAKE_CASE = re.compile(r"\b(?!__)\w+_\w+\b")
+
+
+def _snake_to_words(match):
+    return match.group().replace("_", " ")
+
+
+# Dots between lowercase identifier segments (item.image_url)
+RE_QUALIFIED_DOT = re.compile(r"(?<=[a-z])\.(?=[a-z])")
+
+# Parenthetical file references like (file.php:123)
+RE_FILE_REF = re.compile(r"\([^)]*\.\w+:\d+\)")
+
+# Standalone special chars: $, ^, ~, `, \ (not touching "$5" or "x^2")
+RE_STRAY_SYMBOL = re.compile(r"(?<!\w)[\\$^`~](?!\w)")
+
+# Curly braces and square brackets
+RE_BRACKETS = re.compile(r"[{}\[\]]")
+
+# Runs of repeated punctuation (----, ====, ____)
+RE_REPEATED_PUNCT = re.compile(r"([=\-_]){2,}")
+
+# Runs of spaces/tabs
+RE_MULTI_SPACE = re.compile(r"[ \t]{2,}")
+
+# Blank lines (possibly containing whitespace)
+RE_BLANK_LINES = re.compile(r"\n\s*\n")
+
+# Anything the full clean_text pipeline could act on beyond status lines,
+# numbered lists, qualified-name dots and whitespace. Text without a match
+# (plain prose) takes the short path in clean_text.
+RE_NEEDS_FULL_CLEAN = re.compile(
+    r"[\x1b`*_#<>|&@~^$\\/=(%{}\[\]\u2192\u2190╌╍┈┉•·…"
+    + RE_BOX.pattern[1:-1] + RE_SPINNER.pattern[1:-1] + r"]"
+    r"|--|->|^\s*[+\-]|^[ \t]{4}",
+    re.MULTILINE,
+)
+
+# RE_NEEDS_FULL_CLEAN for pure-ASCII bytes, so clean_text_bytes can pick its
+# path before decoding. Only the ASCII class members can occur, and a bytes
+# \s lacks the \x1c-\x1f separators that str \s matches, so they are spelled out.
+RE_NEEDS_FULL_CLEAN_BYTES = re.compile(
+    rb"[\x1b`*_#<>|&@~^$\\/=(%{}\[\]]|--|->|^[\s\x1c-\x1f]*[+\-]|^[ \t]{4}",
+    re.MULTILINE,
+)
+
 
 def filter_non_speech_content(text: str) -> str:
     """Remove code blocks, tool outputs, JSON, file paths, URLs, and command outputs.
@@ -136,149 +332,166 @@ def filter_non_speech_content(text: str) -> str:
     return text
 
 
-def clean_text(raw: str, skip_code: bool = True, skip_paths: bool = True,
-               filter_tool_output: bool = True) -> str:
-    """Strip terminal formatting and noise from Claude Code output for natural speech."""
-    text = raw
+# Substitution passes for clean_text, in the order they run. Each entry is a
+# (pattern, replacement) pair; the order matters, so add new passes in place.
+_PIPE_HEAD = [
+    (RE_ANSI, ""),              # ANSI escapes
+    (RE_SPINNER, ""),           # spinner/progress chars
+    (RE_BOX, " "),              # box-drawing chars
+    (RE_TOOL_TAGS, ""),         # tool tags
+    (RE_PROGRESS, ""),          # progress bars
+]
+
+# The same passes in bytes mode, for pure-ASCII input (see clean_text_bytes).
+# Spinner and box-drawing chars are non-ASCII, so those passes drop out.
+_PIPE_HEAD_BYTES = [
+    (re.compile(RE_ANSI.pattern.encode("ascii")), b""),
+    (re.compile(RE_TOOL_TAGS.pattern.encode("ascii")), b""),
+    (re.compile(rb"\d+%[\s\x1c-\x1f]*[|\-=>#\[\]]+"), b""),
+]
+
+_PIPE_STATUS = [
+    (RE_TOKENS, ""),            # token counts
+    (RE_TIMING, ""),            # timing lines
+    (RE_COST, ""),              # costs
+    (RE_TOOL_INVOKE, ""),       # tool invocations
+    (RE_LINE_DECORATION, ""),   # decorative lines and diff markers
+]
+
+# File paths sound awful read aloud
+_PIPE_SKIP_PATHS = [
+    (RE_ANY_PATH, " "),
+]
+
+_PIPE_SKIP_CODE = [
+    # Fenced code blocks (```...```) — greedy match between fences
+    (RE_FENCED_CODE, "\n[code block]\n"),
+    # Indented code blocks (4+ spaces, 3+ consecutive lines)
+    (RE_INDENTED_CODE, "[code block]\n"),
+    # Inline backtick code (replace with just the content, no backticks)
+    (RE_INLINE_CODE, r"\1"),
+]
+
+# Markdown and formatting cleanup for natural speech
+_PIPE_MARKDOWN = [
+    (RE_MD_LINK, r"\1"),               # [text](url) -> text
+    (RE_MD_IMAGE, ""),                 # ![alt](url) -> removed
+    (RE_MD_EMPHASIS, r"\1"),           # **text**, *text*
+    (RE_MD_UNDERSCORE_EMPHASIS, r"\1"),  # __text__, _text_
+    (RE_MD_HEADER, ""),                # # Header -> text
+    (RE_MD_RULE, ""),                  # horizontal rules
+    (RE_MD_BULLET, ""),                # - item, * item -> item
+    (RE_MD_NUMBERED, ""),              # 1. item -> item
+    (RE_HTML_TAG, ""),                 # HTML tags that might appear
+    (RE_URL, ""),                      # standalone URLs
+]
+
+_PIPE_TAIL = [
+    # Dots in qualified names (e.g., "item.image_url") -> spaces, but keep
+    # decimals, ellipsis and abbreviations (Dr., U.S.A., etc.)
+    (RE_QUALIFIED_DOT, " "),
+    # Parenthetical references like (line 42) or (file.php:123)
+    (RE_FILE_REF, ""),
+    # Standalone $, ^, ~, `, \ (not $ before digits or ^ in math)
+    (RE_STRAY_SYMBOL, " "),
+    # Curly braces, square brackets (outside of already-handled markdown)
+    (RE_BRACKETS, " "),
+    # Runs of punctuation (---- or ====); keeps "..." and "C++"
+    (RE_REPEATED_PUNCT, " "),
+]
 
-    # Strip ANSI escapes
-    text = RE_ANSI.sub("", text)
 
-    # Strip spinner/progress chars
-    text = RE_SPINNER.sub("", text)
+def _run_pipeline(pipeline, text: str) -> str:
+    """Apply each (pattern, replacement) pass of a pipeline in order."""
+    for pattern, repl in pipeline:
+        text = pattern.sub(repl, text)
+    return text
+
 
-    # Strip box-drawing chars
-    text = RE_BOX.sub(" ", text)
+def clean_text(raw: str, skip_code: bool = True, skip_paths: bool = True,
+               filter_tool_output: bool = True) -> str:
+    """Strip terminal formatting and noise from Claude Code output for natural speech."""
+    if not RE_NEEDS_FULL_CLEAN.search(raw):
+        return _clean_plain_text(raw)
 
-    # Strip tool tags
-    text = RE_TOOL_TAGS.sub("", text)
+    text = _run_pipeline(_PIPE_HEAD, raw)
+    return _clean_body(text, skip_code, skip_paths, filter_tool_output)
 
-    # Strip progress bars
-    text = RE_PROGRESS.sub("", text)
 
-    # Strip token counts, timing lines, costs
-    text = RE_TOKENS.sub("", text)
-    text = RE_TIMING.sub("", text)
-    text = RE_COST.sub("", text)
+def clean_text_bytes(raw: bytes, skip_code: bool = True, skip_paths: bool = True,
+                     filter_tool_output: bool = True) -> str:
+    """clean_text for undecoded UTF-8 input.
 
-    # Strip tool invocations
-    text = RE_TOOL_INVOKE.sub("", text)
+    Pure-ASCII input (the common case for code, paths and ANSI-heavy output)
+    runs the escape/tag/progress passes on the bytes and decodes afterwards.
+    """
+    if not raw.isascii():
+        return clean_text(raw.decode("utf-8", errors="replace"),
+                          skip_code, skip_paths, filter_tool_output)
+    if not RE_NEEDS_FULL_CLEAN_BYTES.search(raw):
+        return _clean_plain_text(raw.decode("ascii"))
+    raw = _run_pipeline(_PIPE_HEAD_BYTES, raw)
+    return _clean_body(raw.decode("ascii"), skip_code, skip_paths, filter_tool_output)
 
-    # Strip diff markers
-    text = RE_DIFF.sub("", text)
 
-    # Strip decorative lines
-    text = RE_DECORATIVE_LINE.sub("", text)
+def _clean_body(text: str, skip_code: bool, skip_paths: bool,
+                filter_tool_output: bool) -> str:
+    """clean_text from the status-line passes onwards."""
+    text = _run_pipeline(_PIPE_STATUS, text)
 
     # Filter non-speech content (code blocks, tool outputs, JSON, etc.)
     if filter_tool_output:
         text = filter_non_speech_content(text)
 
-    # Optionally strip file paths (they sound awful read aloud)
     if skip_paths:
-        text = RE_WIN_PATH.sub(" ", text)
-        text = RE_FILE_PATH.sub(" ", text)
-
-    # Optionally collapse remaining code blocks
+        text = _run_pipeline(_PIPE_SKIP_PATHS, text)
     if skip_code:
-        # Fenced code blocks (```...```) — greedy match between fences
-        text = re.sub(
-            r"```[^\n]*\n.*?```",
-            "\n[code block]\n",
-            text,
-            flags=re.DOTALL,
-        )
-        # Indented code blocks (4+ spaces, 3+ consecutive lines)
-        text = re.sub(
-            r"(?:^[ \t]{4,}\S.*\n){3,}",
-            "[code block]\n",
-            text,
-            flags=re.MULTILINE,
-        )
-        # Inline backtick code (replace with just the content, no backticks)
-        text = re.sub(r"`([^`]+)`", r"\1", text)
-
-    # --- Markdown and formatting cleanup for natural speech ---
-
-    # Markdown links [text](url) -> just the text
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
+        text = _run_pipeline(_PIPE_SKIP_CODE, text)
 
-    # Markdown images ![alt](url) -> remove entirely
-    text = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", text)
+    text = _run_pipeline(_PIPE_MARKDOWN, text)
 
-    # Markdown bold/italic: **text**, __text__, *text*, _text_
-    text = re.sub(r"\*{1,3}([^*]+)\*{1,3}", r"\1", text)
-    text = re.sub(r"_{1,3}(\S[^_]*\S)_{1,3}", r"\1", text)
-
-    # Markdown headers (# Header) -> just the text
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-
-    # Markdown horizontal rules
-    text = re.sub(r"^[\-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
-
-    # Markdown bullet points: - item, * item -> just the text
-    text = re.sub(r"^[\s]*[-*+]\s+", "", text, flags=re.MULTILINE)
-
-    # Numbered lists: 1. item -> just the text
-    text = re.sub(r"^[\s]*\d+[.)]\s+", "", text, flags=re.MULTILINE)
-
-    # HTML tags that might appear
-    text = re.sub(r"<[^>]+>", "", text)
-
-    # URLs (standalone) -> skip them
-    text = re.sub(r"https?://\S+", "", text)
-
-    # Arrow characters -> natural words
-    text = text.replace("\u2192", " to ")
-    text = text.replace("\u2190", " from ")
-    text = text.replace("=>", " to ")
-    text = text.replace("->", " to ")
-    text = text.replace(">>", " ")
-    text = text.replace("<<", " ")
-
-    # Common symbols that get read literally
-    text = text.replace("&amp;", " and ")
-    text = text.replace("&", " and ")
-    text = text.replace("|", " or ")
-    text = text.replace("@", " at ")
-    text = text.replace("~", " ")
+    # Arrows and common symbols that get read literally -> natural words.
+    # Multi-char tokens go first so "&amp;" wins over "&".
+    text = RE_SYMBOL_PAIR.sub(_symbol_pair_word, text)
+    text = text.translate(_SYMBOL_WORDS)
 
     # Underscores in identifiers (snake_case -> "snake case")
-    # Only for words that look like identifiers (letters/digits with underscores)
-    text = re.sub(r"\b(\w+)_(\w+)\b", lambda m: m.group(0).replace("_", " ") if not m.group(0).startswith("__") else m.group(0), text)
+    if "_" in text:
+        text = RE_SNAKE_CASE.sub(_snake_to_words, text)
 
-    # Dots in qualified names (e.g., "item.image_url") -> spaces
-    # But preserve decimal numbers, ellipsis, and abbreviations (Dr., U.S.A., etc.)
-    # Only replace dots between lowercase identifier segments (not after uppercase/digits)
-    text = re.sub(r"(?<=[a-z])\.(?=[a-z])", " ", text)
+    text = _run_pipeline(_PIPE_TAIL, text)
 
-    # Parenthetical references like (line 42) or (file.php:123) - keep meaningful ones
-    text = re.sub(r"\([^)]*\.\w+:\d+\)", "", text)
+    return _collapse_whitespace(text)
 
-    # Strip standalone special chars: $, ^, ~, `, \
-    # But be careful not to strip $ before digits (e.g. "$5") or ^ in math
-    text = re.sub(r"(?<!\w)[\\$^`~](?!\w)", " ", text)
 
-    # Curly braces, square brackets (outside of already-handled markdown)
-    text = re.sub(r"[{}\[\]]", " ", text)
+def _clean_plain_text(text: str) -> str:
+    """clean_text for input without markup, symbols or terminal noise.
+
+    Only the passes that can still match plain prose are run, in the same
+    order as the full pipeline.
+    """
+    text = RE_TOKENS.sub("", text)
+    text = RE_TIMING.sub("", text)
+    text = RE_COST.sub("", text)
+    text = RE_TOOL_INVOKE.sub("", text)
+    text = RE_MD_NUMBERED.sub("", text)
+    text = RE_QUALIFIED_DOT.sub(" ", text)
+    return _collapse_whitespace(text)
 
-    # Multiple punctuation (... is ok, but ---- or ==== etc.)
-    # Preserve plus signs so "C++", "g++", etc. stay intact
-    text = re.sub(r"([=\-_]){2,}", " ", text)
 
+def _collapse_whitespace(text: str) -> str:
+    """Final whitespace cleanup shared by the clean_text paths."""
     # Collapse multiple spaces
-    text = re.sub(r"[ \t]{2,}", " ", text)
+    text = RE_MULTI_SPACE.sub(" ", text)
 
     # Collapse all blank lines to single newline (reduces TTS pauses)
-    text = re.sub(r"\n\s*\n", "\n", text)
+    text = RE_BLANK_LINES.sub("\n", text)
 
     # Strip leading/trailing whitespace per line
-    text = "\n".join(line.strip() for line in text.splitlines())
+    text = "\n".join(map(str.strip, text.splitlines()))
 
     # Final trim
-    text = text.strip()
-
-    return text
+    return text.strip()
 
 
 # ─── TTS Backends ─────────────────────────────────────────────────────────────
@@ -287,9 +500,7 @@ def clean_text(raw: str, skip_code: bool = True, skip_paths: bool = True,
 async def tts_edge_async(text: str, voice: str, rate: str, output_path: str,
                          volume: int = 100) -> str:
     """Generate speech using edge-tts (free)."""
-    try:
-        import edge_tts
-    except ImportError:
+    if _EDGE_COMMUNICATE is None:
         print("ERROR: edge-tts not installed. Run: pip install edge-tts", file=sys.stderr)
         sys.exit(1)
 
@@ -298,7 +509,7 @@ async def tts_edge_async(text: str, voice: str, rate: str, output_path: str,
     volume_str = f"{volume - 100}%" if volume < 100 else "+0%"
 
     try:
-        communicate = edge_tts.Communicate(text, voice, rate=rate, volume=volume_str)
+        communicate = _EDGE_COMMUNICATE(text, voice, rate=rate, volume=volume_str)
         await communicate.save(output_path)
     except Exception as e:
         err = str(e)
@@ -326,6 +537,46 @@ def tts_edge(text: str, voice: str, rate: str, output_path: str,
     return asyncio.run(tts_edge_async(text, voice, rate, output_path, volume=volume))
 
 
+# Max concurrent OpenAI requests when a long text is split into chunks
+OPENAI_MAX_PARALLEL = 4
+
+# Bytes read per step when streaming OpenAI audio to disk
+OPENAI_STREAM_CHUNK = 1 << 15
+
+# OpenAI clients keyed by API key, so repeated calls reuse the HTTP
+# connection pool instead of paying a new TLS handshake per request
+_openai_clients = {}
+_openai_clients_lock = threading.Lock()
+
+
+def _get_openai_client(client_cls, api_key: str):
+    """Return a cached OpenAI client for the given API key."""
+    with _openai_clients_lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            client = client_cls(api_key=api_key)
+            _openai_clients[api_key] = client
+        return client
+
+
+def _openai_speech_to_file(client, text: str, voice: str, speed: float, path: str):
+    """Synthesize one request-sized chunk with OpenAI and write it to path.
+
+    The audio is streamed to disk as it arrives rather than buffered whole.
+    """
+    with client.audio.speech.with_streaming_response.create(
+        model="gpt-4o-mini-tts",
+        voice=voice,
+        input=text,
+        speed=speed,
+        response_format="mp3",
+        instructions="Read this text naturally and clearly. It is output from a coding assistant. Skip any formatting artifacts, read code-related terms clearly.",
+    ) as response:
+        with open(path, "wb") as f:
+            for data in response.iter_bytes(OPENAI_STREAM_CHUNK):
+                f.write(data)
+
+
 def tts_openai(text: str, voice: str, speed: float, output_path: str,
                volume: int = 100) -> str:
     """Generate speech using OpenAI gpt-4o-mini-tts (paid, best quality)."""
@@ -340,7 +591,7 @@ def tts_openai(text: str, voice: str, speed: float, output_path: str,
         print("ERROR: OPENAI_API_KEY environment variable not set.", file=sys.stderr)
         sys.exit(1)
 
-    client = OpenAI(api_key=api_key)
+    client = _get_openai_client(OpenAI, api_key)
 
     # gpt-4o-mini-tts supports max 2000 tokens input per request.
     # For longer texts, chunk and concatenate.
@@ -348,27 +599,18 @@ def tts_openai(text: str, voice: str, speed: float, output_path: str,
     chunks = _chunk_text(text, max_chars)
 
     if len(chunks) == 1:
-        response = client.audio.speech.create(
-            model="gpt-4o-mini-tts",
-            voice=voice,
-            input=chunks[0],
-            speed=speed,
-            instructions="Read this text naturally and clearly. It is output from a coding assistant. Skip any formatting artifacts, read code-related terms clearly.",
-        )
-        response.stream_to_file(output_path)
+        _openai_speech_to_file(client, chunks[0], voice, speed, output_path)
     else:
-        temp_files = []
-        for i, chunk in enumerate(chunks):
-            chunk_path = output_path.replace(".mp3", f"_chunk{i}.mp3")
-            response = client.audio.speech.create(
-                model="gpt-4o-mini-tts",
-                voice=voice,
-                input=chunk,
-                speed=speed,
-                instructions="Read this text naturally and clearly. It is output from a coding assistant. Skip any formatting artifacts, read code-related terms clearly.",
-            )
-            response.stream_to_file(chunk_path)
-            temp_files.append(chunk_path)
+        temp_files = [
+            output_path.replace(".mp3", f"_chunk{i}.mp3") for i in range(len(chunks))
+        ]
+        # Chunks are independent requests; run them concurrently so the wait is
+        # the slowest chunk rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=min(len(chunks), OPENAI_MAX_PARALLEL)) as pool:
+            list(pool.map(
+                lambda chunk, path: _openai_speech_to_file(client, chunk, voice, speed, path),
+                chunks, temp_files,
+            ))
 
         _concat_mp3(temp_files, output_path, volume=volume)
         for f in temp_files:
@@ -380,6 +622,20 @@ def tts_openai(text: str, voice: str, speed: float, output_path: str,
     return output_path
 
 
+# Paragraph and sentence boundaries used when chunking text for synthesis
+RE_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+RE_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def _iter_split(pattern, text: str):
+    """Lazy pattern.split(text), for patterns without groups."""
+    start = 0
+    for match in pattern.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
+
 def _chunk_text(text: str, max_chars: int) -> list:
     """Split text into chunks at sentence boundaries."""
     if len(text) <= max_chars:
@@ -388,7 +644,7 @@ def _chunk_text(text: str, max_chars: int) -> list:
     chunks = []
     current = ""
 
-    for sentence in re.split(r"(?<=[.!?])\s+", text):
+    for sentence in _iter_split(RE_SENTENCE_BREAK, text):
         if len(current) + len(sentence) + 1 > max_chars and current:
             chunks.append(current.strip())
             current = sentence
@@ -402,7 +658,10 @@ def _chunk_text(text: str, max_chars: int) -> list:
 
 
 def _concat_mp3(files: list, output: str, volume: int = 100):
-    """Concatenate MP3 files using ffmpeg, or play sequentially as fallback."""
+    """Concatenate MP3 files using ffmpeg, or play sequentially as fallback.
+
+    In the fallback the last input file is moved to output.
+    """
     ffmpeg = shutil.which("ffmpeg")
     if not ffmpeg:
         # Fallback: play segments sequentially instead of producing an invalid
@@ -415,10 +674,14 @@ def _concat_mp3(files: list, output: str, volume: int = 100):
         for f in files:
             if _validate_audio_file(f):
                 play_audio(f, volume=volume)
-        # Write the last chunk as the "output" so callers that check the file
-        # still find something valid.
+        # Leave the last chunk as the "output" so callers that check the file
+        # still find something valid. The chunks are temporary, so it is moved
+        # rather than copied; fall back to a copy if the move fails.
         if files and _validate_audio_file(files[-1]):
-            shutil.copy2(files[-1], output)
+            try:
+                os.replace(files[-1], output)
+            except OSError:
+                shutil.copyfile(files[-1], output)
         return
 
     list_file = output + ".list"
@@ -611,14 +874,140 @@ def play_audio(path: str, blocking: bool = True, volume: int = 100):
     return False
 
 
+# ─── File Change Notification ─────────────────────────────────────────────────
+
+# Longest a notifier-driven loop blocks before re-checking state (keeps
+# Ctrl+C responsive and catches anything the OS failed to report)
+NOTIFY_MAX_WAIT = 1.0
+
+# Watchdog event types that mean file content or presence changed. Opened and
+# closed-without-write events are ignored: our own reads would trigger them.
+_CHANGE_EVENT_TYPES = frozenset(("created", "modified", "moved", "deleted", "closed"))
+
+
+class ChangeNotifier:
+    """Wake a waiting thread when files in a directory change.
+
+    Backed by watchdog (inotify, FSEvents/kqueue, ReadDirectoryChangesW).
+    Create one with start_change_notifier(), which returns None when watchdog
+    is not installed so callers can keep their polling loop. With a suffix,
+    only files whose name ends with it are reported; with max_depth, only
+    files at most that many directories below the watched one.
+    """
+
+    def __init__(self, directory: str, recursive: bool = False, suffix: str = None,
+                 max_depth: int = None):
+        self._changed = threading.Event()
+        self._suffix = suffix
+        self._directory = directory
+        self._max_depth = max_depth
+        self.last_path = None  # Most recently written (not deleted) file
+        self._observer = _WatchdogObserver()
+        self._observer.schedule(self, directory, recursive=recursive)
+        self._observer.daemon = True
+        self._observer.start()
+
+    def dispatch(self, event):
+        """Watchdog event handler entry point."""
+        if event.is_directory or event.event_type not in _CHANGE_EVENT_TYPES:
+            return
+        path = getattr(event, "dest_path", "") or event.src_path
+        if self._suffix and not path.endswith(self._suffix):
+            return
+        if (self._max_depth is not None
+                and os.path.relpath(path, self._directory).count(os.sep) > self._max_depth):
+            return
+        if event.event_type != "deleted":
+            self.last_path = path
+        self._changed.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until a change is reported or timeout elapses.
+
+        Returns True if something changed. Callers re-read whatever they
+        watch afterwards, so a change landing during that read is not lost.
+        """
+        changed = self._changed.wait(timeout)
+        self._changed.clear()
+        return changed
+
+    def stop(self):
+        """Stop the underlying observer thread."""
+        self._observer.stop()
+        self._observer.join(timeout=2)
+
+
+def start_change_notifier(directory: str, recursive: bool = False, suffix: str = None,
+                          max_depth: int = None):
+    """Return a running ChangeNotifier, or None if unavailable."""
+    if _WatchdogObserver is None:
+        return None
+    try:
+        return ChangeNotifier(directory, recursive=recursive, suffix=suffix,
+                              max_depth=max_depth)
+    except OSError:
+        # e.g. inotify watch limit reached — fall back to polling
+        return None
+
+
 # ─── Real-time Follow Mode ────────────────────────────────────────────────────
 
 
+# Max characters of queued text combined into one synthesis request
+BATCH_MAX_CHARS = 1500
+
+# Concurrent synthesis workers (edge-tts throttles beyond a few connections)
+SYNTH_WORKERS = 3
+
+# Synthesized chunks allowed to wait for playback
+PLAY_AHEAD = 3
+
+
+class _OrderedPlayBuffer:
+    """Bounded hand-off from synth workers to the player, in sequence order.
+
+    Workers finish out of order; get() only returns the item for the next
+    expected sequence number. put() blocks while the buffer is full, except
+    for the next expected item, which always goes in so playback can't stall.
+    """
+
+    def __init__(self, maxsize: int):
+        self._heap = []
+        self._next_seq = 0
+        self._maxsize = maxsize
+        self._cond = threading.Condition()
+
+    def put(self, seq: int, item):
+        with self._cond:
+            while len(self._heap) >= self._maxsize and seq != self._next_seq:
+                self._cond.wait()
+            heapq.heappush(self._heap, (seq, item))
+            self._cond.notify_all()
+
+    def get(self):
+        with self._cond:
+            while not self._heap or self._heap[0][0] != self._next_seq:
+                self._cond.wait()
+            _, item = heapq.heappop(self._heap)
+            self._next_seq += 1
+            self._cond.notify_all()
+            return item
+
+
+# Marks the end of playback in the play buffer
+_PLAY_DONE = object()
+
+
 class SpeechQueue:
-    """Queue-based speech system for real-time output."""
+    """Queue-based speech system for real-time output.
+
+    A few synth workers generate audio concurrently while a single player
+    thread plays it back in the order the text was enqueued.
+    """
 
     def __init__(self, backend: str, voice: str, rate: str, speed: float,
-                 skip_code: bool, skip_paths: bool, volume: int = 100):
+                 skip_code: bool, skip_paths: bool, volume: int = 100,
+                 synth_workers: int = SYNTH_WORKERS):
         self.backend = backend
         self.voice = voice
         self.rate = rate
@@ -626,85 +1015,169 @@ class SpeechQueue:
         self.skip_code = skip_code
         self.skip_paths = skip_paths
         self.volume = volume
-        self.queue = queue.Queue()
+        self.queue = queue.Queue()  # (seq, text) pairs, None to stop
+        # Per seq: (audio path, cleaned text) to play, or None if there is
+        # nothing to play for it. The path is None when the primary backend
+        # failed and the platform fallback should speak instead.
+        self._play_buffer = _OrderedPlayBuffer(PLAY_AHEAD)
+        self._seq_lock = threading.Lock()
+        # Held while a worker takes an entry and drains the ones after it,
+        # so every batch is a run of consecutive seqs
+        self._dequeue_lock = threading.Lock()
+        self._next_seq = 0
+        self._workers_alive = synth_workers
         self.running = True
-        self._loop = None  # Dedicated event loop for worker thread
-        self.worker = threading.Thread(target=self._worker, daemon=True)
-        self.worker.start()
         self.temp_dir = tempfile.mkdtemp(prefix="cc_speak_")
-        self.file_counter = 0
+        self.workers = [
+            threading.Thread(target=self._worker, daemon=True) for _ in range(synth_workers)
+        ]
+        self.player = threading.Thread(target=self._play_worker, daemon=True)
+        for worker in self.workers:
+            worker.start()
+        self.player.start()
 
     def _worker(self):
-        """Background worker that processes speech queue."""
+        """Background worker that synthesizes queued text."""
         # Create a dedicated event loop for this thread so that
         # asyncio.run() / loop.run_until_complete() never conflicts
         # with the main thread's event loop.
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
 
         try:
             while self.running or not self.queue.empty():
                 try:
-                    text = self.queue.get(timeout=0.5)
-                    if text is None:  # Poison pill
+                    # A batch plays under its first seq, so it must not skip
+                    # entries another worker grabbed mid-drain
+                    with self._dequeue_lock:
+                        entry = self.queue.get(timeout=0.5)
+                        if entry is None:  # Poison pill
+                            break
+                        batch, stop = self._drain_batch(entry)
+                    item = None
+                    try:
+                        item = self._synthesize([text for _, text in batch], batch[0][0], loop)
+                    finally:
+                        # The whole batch plays under its first seq; the
+                        # rest get empty slots so the player moves past them
+                        self._play_buffer.put(batch[0][0], item)
+                        for seq, _ in batch[1:]:
+                            self._play_buffer.put(seq, None)
+                    for _ in batch:
+                        self.queue.task_done()
+                    if stop:
                         break
-                    self._speak(text)
-                    self.queue.task_done()
                 except queue.Empty:
                     continue
         finally:
-            self._loop.close()
-            self._loop = None
+            loop.close()
+            with self._seq_lock:
+                self._workers_alive -= 1
+                last = self._workers_alive == 0
+                end_seq = self._next_seq
+            if last:
+                # Everything enqueued has been handed over; end playback after it
+                self._play_buffer.put(end_seq, _PLAY_DONE)
+
+    def _play_worker(self):
+        """Background worker that plays synthesized audio in order."""
+        while True:
+            item = self._play_buffer.get()
+            if item is _PLAY_DONE:
+                break
+            if item is None:
+                continue
+            output_path, cleaned = item
+            try:
+                if output_path is None:
+                    tts_fallback(cleaned, volume=self.volume)
+                    continue
+                play_audio(output_path, volume=self.volume)
+                try:
+                    os.remove(output_path)
+                except OSError:
+                    pass
+            except Exception as e:
+                print(f"Playback error: {e}", file=sys.stderr)
+
+    def _drain_batch(self, entry: tuple):
+        """Collect entry plus whatever is already queued, up to BATCH_MAX_CHARS.
+
+        Each synthesis call pays a fresh connection handshake, so chunks that
+        piled up during playback are spoken with a single request. Returns
+        (batch, stop) where stop is True if the poison pill was reached.
+        """
+        batch = [entry]
+        size = len(entry[1])
+        while size < BATCH_MAX_CHARS:
+            try:
+                nxt = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if nxt is None:
+                return batch, True
+            batch.append(nxt)
+            size += len(nxt[1])
+        return batch, False
+
+    def _synthesize(self, texts: list, seq: int, loop: asyncio.AbstractEventLoop):
+        """Generate speech for a batch of texts.
+
+        Returns the play item for the batch, or None if nothing is speakable.
+        """
+        parts = []
+        for text in texts:
+            cleaned = clean_text(text, skip_code=self.skip_code, skip_paths=self.skip_paths)
+            if not cleaned.strip():
+                continue
 
-    def _speak(self, text: str):
-        """Generate and play speech for text."""
-        cleaned = clean_text(text, skip_code=self.skip_code, skip_paths=self.skip_paths)
-        if not cleaned.strip():
-            return
+            # Skip very short fragments
+            if len(cleaned.split()) < 3:
+                continue
 
-        # Skip very short fragments
-        if len(cleaned.split()) < 3:
-            return
+            parts.append(cleaned)
+
+        if not parts:
+            return None
+        cleaned = "\n".join(parts)
 
-        self.file_counter += 1
-        output_path = os.path.join(self.temp_dir, f"speech_{self.file_counter}.mp3")
+        output_path = os.path.join(self.temp_dir, f"speech_{seq}.mp3")
 
         try:
             result = None
             if self.backend == "edge":
                 result = tts_edge(cleaned, self.voice, self.rate, output_path,
-                                  volume=self.volume, loop=self._loop)
+                                  volume=self.volume, loop=loop)
             else:
                 result = tts_openai(cleaned, self.voice, self.speed, output_path,
                                     volume=self.volume)
 
             if result and _validate_audio_file(output_path):
-                play_audio(output_path, volume=self.volume)
-                try:
-                    os.remove(output_path)
-                except OSError:
-                    pass
+                return (output_path, cleaned)
             elif result is None:
                 # Primary TTS failed — try platform fallback
                 print("INFO: Primary TTS failed, trying platform fallback...", file=sys.stderr)
-                tts_fallback(cleaned, volume=self.volume)
+                return (None, cleaned)
         except Exception as e:
             print(f"Speech error: {e}", file=sys.stderr)
             # Last resort: platform fallback
-            try:
-                tts_fallback(cleaned, volume=self.volume)
-            except Exception:
-                pass
+            return (None, cleaned)
+        return None
 
     def enqueue(self, text: str):
         """Add text to speech queue."""
-        self.queue.put(text)
+        with self._seq_lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            self.queue.put((seq, text))
 
     def stop(self):
-        """Stop the speech worker."""
+        """Stop the speech workers."""
         self.running = False
         self.queue.put(None)  # Poison pill
-        self.worker.join(timeout=5)
+        for worker in self.workers:
+            worker.join(timeout=5)
+        self.player.join(timeout=5)
         # Cleanup temp dir
         try:
             import shutil as _shutil
@@ -713,37 +1186,36 @@ class SpeechQueue:
             pass
 
 
-def extract_speakable_chunks(text: str) -> list:
-    """Extract speakable chunks from text, splitting at natural boundaries."""
-    # Split on paragraph boundaries (double newlines) or sentence endings
-    chunks = []
-
-    # First split on paragraphs
-    paragraphs = re.split(r'\n\s*\n', text)
+def stream_chunks(text: str, hard_max: int = 500, soft_max: int = 400):
+    """Yield speakable chunks from text, splitting at natural boundaries.
 
-    for para in paragraphs:
+    Paragraphs shorter than hard_max are yielded whole; longer ones are split
+    into sentences and regrouped into chunks under soft_max.
+    """
+    for para in _iter_split(RE_PARAGRAPH_BREAK, text):
         para = para.strip()
         if not para:
             continue
 
-        # If paragraph is short enough, use as-is
-        if len(para) < 500:
-            chunks.append(para)
-        else:
-            # Split long paragraphs into sentences
-            sentences = re.split(r'(?<=[.!?])\s+', para)
-            current = ""
-            for sent in sentences:
-                if len(current) + len(sent) < 400:
-                    current = f"{current} {sent}".strip()
-                else:
-                    if current:
-                        chunks.append(current)
-                    current = sent
-            if current:
-                chunks.append(current)
+        if len(para) < hard_max:
+            yield para
+            continue
 
-    return chunks
+        current = ""
+        for sent in _iter_split(RE_SENTENCE_BREAK, para):
+            if len(current) + len(sent) < soft_max:
+                current = f"{current} {sent}".strip()
+            else:
+                if current:
+                    yield current
+                current = sent
+        if current:
+            yield current
+
+
+def extract_speakable_chunks(text: str) -> list:
+    """Extract speakable chunks from text, splitting at natural boundaries."""
+    return list(stream_chunks(text))
 
 
 def follow_file(filepath: str, speech_queue: SpeechQueue, debounce_ms: int = 2000):
@@ -759,6 +1231,9 @@ def follow_file(filepath: str, speech_queue: SpeechQueue, debounce_ms: int = 200
     print(f"Watching: {filepath}", file=sys.stderr)
     print("Press Ctrl+C to stop\n", file=sys.stderr)
 
+    # Block on OS change notifications when available instead of polling
+    notifier = start_change_notifier(str(filepath.parent))
+
     last_size = filepath.stat().st_size
     last_change = time.time()
     pending_text = ""
@@ -790,20 +1265,30 @@ def follow_file(filepath: str, speech_queue: SpeechQueue, debounce_ms: int = 200
 
             # Check if we should speak (debounce: wait for pause in output)
             if pending_text and (time.time() - last_change) * 1000 > debounce_ms:
-                chunks = extract_speakable_chunks(pending_text)
-                for chunk in chunks:
+                for chunk in stream_chunks(pending_text):
                     speech_queue.enqueue(chunk)
                 pending_text = ""
 
-            time.sleep(0.1)
+            if notifier is None:
+                time.sleep(0.1)
+                continue
+
+            # Sleep until the file changes, waking in time to flush pending text
+            timeout = NOTIFY_MAX_WAIT
+            if pending_text:
+                remaining = debounce_ms / 1000 - (time.time() - last_change)
+                timeout = min(timeout, max(remaining, 0) + 0.01)
+            notifier.wait(timeout)
 
     except KeyboardInterrupt:
         print("\nStopping...", file=sys.stderr)
         # Speak any remaining text
         if pending_text.strip():
-            chunks = extract_speakable_chunks(pending_text)
-            for chunk in chunks:
+            for chunk in stream_chunks(pending_text):
                 speech_queue.enqueue(chunk)
+    finally:
+        if notifier is not None:
+            notifier.stop()
 
 
 def follow_stdin(speech_queue: SpeechQueue, debounce_ms: int = 2000):
@@ -839,8 +1324,7 @@ def follow_stdin(speech_queue: SpeechQueue, debounce_ms: int = 2000):
 
                 # Debounce and speak
                 if pending_text and (time.time() - last_input) * 1000 > debounce_ms:
-                    chunks = extract_speakable_chunks(pending_text)
-                    for chunk in chunks:
+                    for chunk in stream_chunks(pending_text):
                         speech_queue.enqueue(chunk)
                     pending_text = ""
 
@@ -851,20 +1335,26 @@ def follow_stdin(speech_queue: SpeechQueue, debounce_ms: int = 2000):
         # Unix: use select for non-blocking stdin
         import select
 
+        # Read whatever is available straight from the fd and decode it in
+        # bulk; the incremental decoder keeps multi-byte characters that are
+        # split across reads intact
+        fd = sys.stdin.fileno()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
         try:
             while True:
-                readable, _, _ = select.select([sys.stdin], [], [], 0.1)
+                readable, _, _ = select.select([fd], [], [], 0.1)
                 if readable:
-                    line = sys.stdin.readline()
-                    if not line:  # EOF
+                    data = os.read(fd, 65536)
+                    if not data:  # EOF
+                        pending_text += decoder.decode(b"", final=True)
                         break
-                    pending_text += line
+                    pending_text += decoder.decode(data)
                     last_input = time.time()
 
                 # Debounce and speak
                 if pending_text and (time.time() - last_input) * 1000 > debounce_ms:
-                    chunks = extract_speakable_chunks(pending_text)
-                    for chunk in chunks:
+                    for chunk in stream_chunks(pending_text):
                         speech_queue.enqueue(chunk)
                     pending_text = ""
 
@@ -873,8 +1363,7 @@ def follow_stdin(speech_queue: SpeechQueue, debounce_ms: int = 2000):
 
     # Speak remaining
     if pending_text.strip():
-        chunks = extract_speakable_chunks(pending_text)
-        for chunk in chunks:
+        for chunk in stream_chunks(pending_text):
             speech_queue.enqueue(chunk)
 
 
@@ -1008,29 +1497,32 @@ def main():
     # One-shot mode: Read input
     if args.file:
         try:
-            with open(args.file, "r", encoding="utf-8", errors="replace") as f:
-                raw_text = f.read()
+            with open(args.file, "rb") as f:
+                raw_bytes = f.read()
         except FileNotFoundError:
             print(f"ERROR: File not found: {args.file}", file=sys.stderr)
             sys.exit(1)
     elif not sys.stdin.isatty():
-        raw_text = sys.stdin.read()
+        raw_bytes = sys.stdin.buffer.read()
     else:
         print("ERROR: No input. Pipe text or provide a filename.", file=sys.stderr)
         print("  Usage: claude 'explain X' 2>/dev/null | cc-speak", file=sys.stderr)
         print("  Real-time: cc-speak --follow /tmp/claude.log", file=sys.stderr)
         sys.exit(1)
 
-    if not raw_text.strip():
+    if not raw_bytes.strip():
         print("WARNING: Empty input, nothing to read.", file=sys.stderr)
         sys.exit(0)
 
+    # Same newline handling as a text-mode read
+    raw_bytes = raw_bytes.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
     # Clean text
     if args.raw:
-        text = raw_text
+        text = raw_bytes.decode("utf-8", errors="replace")
     else:
-        text = clean_text(
-            raw_text,
+        text = clean_text_bytes(
+            raw_bytes,
             skip_code=not args.keep_code,
             skip_paths=not args.keep_paths,
             filter_tool_output=not args.keep_tool_output,
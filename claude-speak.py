@@ -14,19 +14,26 @@ Usage:
 import json
 import sys
 import os
-import glob
 import threading
 import queue
+import select
 import time
 import tempfile
 import shutil
 import signal
 import atexit
+import errno
 import hashlib
 import base64
 import collections
+import functools
 import logging
 
+try:
+    from orjson import loads as _json_loads  # optional: pip install orjson
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger("claude-speak")
 logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s", stream=sys.stderr)
 
@@ -43,12 +50,36 @@ spec.loader.exec_module(cc_speak)
 # Base directory where Claude stores all conversation logs
 CLAUDE_PROJECTS_DIR = os.path.join(os.path.expanduser("~"), ".claude", "projects")
 
+# Global pause flag and voice override (per-project ones live in the project dir)
+GLOBAL_PAUSE_FLAG = os.path.join(os.path.expanduser("~"), ".claude", "speech-paused")
+GLOBAL_VOICE_FILE = os.path.join(os.path.expanduser("~"), ".claude", "speech-voice")
+
+# Seconds between log checks when watchdog is unavailable
+POLL_INTERVAL = 1.0
+
+# Seconds between full rescans for the active log (0 disables them). The
+# change notifier switches logs as they are written, so with watchdog the
+# rescan is only a safety net; when polling it is how new sessions are found
+RESCAN_INTERVAL = 30
+POLL_RESCAN_INTERVAL = 5
+
+# Message IDs remembered for deduplication
+SPOKEN_IDS_MAX = 4096
+
+# Synthesized clips allowed to wait for playback
+PLAY_AHEAD = 4
 
+
+@functools.lru_cache(maxsize=256)
 def _normalize_path(path):
-    """Normalize a file path for consistent comparison (case-insensitive on Windows)."""
+    """Normalize a file path for consistent comparison (case-insensitive on Windows).
+
+    Cached, since the watch loop keeps normalizing the same few log paths.
+    """
     if path is None:
         return None
-    p = os.path.normpath(os.path.abspath(path))
+    # Log paths are already absolute; abspath would only add a getcwd call
+    p = os.path.normpath(path) if os.path.isabs(path) else os.path.abspath(path)
     if os.name == 'nt':
         p = p.lower()
     return p
@@ -76,6 +107,32 @@ def decode_dirname_to_cwd(dirname):
     return base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
 
 
+# Config file contents keyed by path -> ((mtime_ns, size), stripped text)
+_config_file_cache = {}
+
+
+def _read_config_file(path):
+    """Return the stripped contents of a small config file, or None if missing.
+
+    Contents are cached by mtime and size, so an unchanged file costs one stat.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_file_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(path, "r") as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+    _config_file_cache[path] = (stamp, value)
+    return value
+
+
 def is_speech_paused(cwd=None):
     """Check if speech is paused for a specific project (or globally)."""
     # Check per-project pause flag first
@@ -85,8 +142,7 @@ def is_speech_paused(cwd=None):
         if os.path.exists(project_flag):
             return True
     # Fall back to global pause flag
-    global_flag = os.path.join(os.path.expanduser("~"), ".claude", "speech-paused")
-    return os.path.exists(global_flag)
+    return os.path.exists(GLOBAL_PAUSE_FLAG)
 
 
 def get_voice_override(cwd=None):
@@ -95,25 +151,11 @@ def get_voice_override(cwd=None):
     if cwd:
         dirname = encode_cwd_to_dirname(cwd)
         project_voice = os.path.join(CLAUDE_PROJECTS_DIR, dirname, "speech-voice")
-        if os.path.exists(project_voice):
-            try:
-                with open(project_voice, "r") as f:
-                    voice = f.read().strip()
-                    if voice:
-                        return voice
-            except OSError:
-                pass
+        voice = _read_config_file(project_voice)
+        if voice:
+            return voice
     # Fall back to global voice config
-    global_voice = os.path.join(os.path.expanduser("~"), ".claude", "speech-voice")
-    if os.path.exists(global_voice):
-        try:
-            with open(global_voice, "r") as f:
-                voice = f.read().strip()
-                if voice:
-                    return voice
-        except OSError:
-            pass
-    return None
+    return _read_config_file(GLOBAL_VOICE_FILE) or None
 
 
 def find_project_jsonl_dir(cwd):
@@ -125,26 +167,36 @@ def find_project_jsonl_dir(cwd):
     return None
 
 
+def _entry_mtime(entry):
+    """Sort key for DirEntry objects (stat is cached by scandir on Windows)."""
+    return entry.stat().st_mtime
+
+
 def find_latest_jsonl_in_dir(directory):
     """Find the most recently modified JSONL file in a directory."""
-    jsonl_files = glob.glob(os.path.join(directory, "*.jsonl"))
-    if not jsonl_files:
+    try:
+        with os.scandir(directory) as it:
+            # Skip dotfiles, like the "*.jsonl" glob this replaced
+            jsonl_files = [
+                e for e in it
+                if e.name.endswith(".jsonl") and not e.name.startswith(".") and e.is_file()
+            ]
+        if not jsonl_files:
+            return None
+        return max(jsonl_files, key=_entry_mtime).path
+    except OSError:
         return None
-    return max(jsonl_files, key=os.path.getmtime)
 
 
 def find_active_jsonl_global():
     """Find the most recently modified JSONL file across ALL projects."""
     try:
-        project_dirs = [
-            os.path.join(CLAUDE_PROJECTS_DIR, d)
-            for d in os.listdir(CLAUDE_PROJECTS_DIR)
-            if os.path.isdir(os.path.join(CLAUDE_PROJECTS_DIR, d))
-        ]
+        with os.scandir(CLAUDE_PROJECTS_DIR) as it:
+            project_dirs = [e for e in it if e.is_dir()]
         if not project_dirs:
             return None
-        latest_dir = max(project_dirs, key=os.path.getmtime)
-        return find_latest_jsonl_in_dir(latest_dir)
+        latest_dir = max(project_dirs, key=_entry_mtime)
+        return find_latest_jsonl_in_dir(latest_dir.path)
     except (OSError, ValueError):
         return None
 
@@ -156,8 +208,12 @@ def extract_text_from_line(line):
     can be split across multiple JSONL lines with different uuids but the same
     message.id.
     """
+    # Most lines are user, tool or progress records; skip them without parsing
+    if '"assistant"' not in line:
+        return None, None
+
     try:
-        data = json.loads(line)
+        data = _json_loads(line)
     except (json.JSONDecodeError, ValueError):
         return None, None
 
@@ -199,17 +255,49 @@ def _get_pid_file_path(cwd):
     return os.path.join(os.path.expanduser("~"), ".claude", "speech-monitor.pid")
 
 
+# kernel32 with prototypes for _is_process_running, loaded on first use (Windows only)
+_kernel32 = None
+
+
+def _get_kernel32():
+    """Return kernel32 with the process-query functions' prototypes set."""
+    global _kernel32
+    if _kernel32 is None:
+        import ctypes
+        from ctypes import wintypes
+        # A private WinDLL instance, so the prototypes don't leak into ctypes.windll
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        _kernel32 = kernel32
+    return _kernel32
+
+
 def _is_process_running(pid):
     """Check if a process with the given PID is still running."""
     try:
         if os.name == 'nt':
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
-            handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
-            if handle:
+            kernel32 = _get_kernel32()
+            # PROCESS_QUERY_LIMITED_INFORMATION | SYNCHRONIZE
+            handle = kernel32.OpenProcess(0x1000 | 0x00100000, False, pid)
+            if not handle:
+                # SYNCHRONIZE can be denied (e.g. elevated process); existence is
+                # all we can check then
+                handle = kernel32.OpenProcess(0x1000, False, pid)
+                if handle:
+                    kernel32.CloseHandle(handle)
+                    return True
+                return False
+            try:
+                # An exited process can still be opened while someone holds a
+                # handle to it; it is only running if it isn't signaled yet
+                return kernel32.WaitForSingleObject(handle, 0) == 0x102  # WAIT_TIMEOUT
+            finally:
                 kernel32.CloseHandle(handle)
-                return True
-            return False
         else:
             os.kill(pid, 0)
             return True
@@ -217,17 +305,67 @@ def _is_process_running(pid):
         return False
 
 
+# Byte offset locked on Windows: past the PID text, so other processes can
+# still read the PID while the lock is held
+_PID_LOCK_OFFSET = 1024
+
+# Descriptor of the locked PID file, held open for the life of the process
+_pid_lock_fd = None
+
+
+def _try_lock_fd(fd):
+    """Take an exclusive, non-blocking OS lock on an open file.
+
+    Returns True if locked, False if another process holds the lock, or None
+    if the file system doesn't support locking.
+    """
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            os.lseek(fd, _PID_LOCK_OFFSET, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError as e:
+        if e.errno in (errno.EACCES, errno.EAGAIN, errno.EWOULDBLOCK, errno.EDEADLK):
+            return False
+        return None
+
+
 def acquire_pid_lock(cwd):
     """Acquire PID file lock atomically. Returns True if acquired, False if another monitor is running.
 
-    Uses open(..., 'x') for atomic exclusive creation to eliminate TOCTOU race conditions.
+    Holds an OS lock (flock / msvcrt.locking) on the open PID file for the
+    life of the process. The kernel drops it however the process exits, so
+    there is no stale-PID check and no race between two monitors starting.
+    Where locking is unsupported, falls back to exclusive creation plus a
+    liveness check on the stored PID.
     """
+    global _pid_lock_fd
     pid_file = _get_pid_file_path(cwd)
     our_pid = str(os.getpid())
 
     os.makedirs(os.path.dirname(pid_file), exist_ok=True)
 
-    # Attempt atomic exclusive creation first
+    try:
+        fd = os.open(pid_file, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        fd = None
+    if fd is not None:
+        locked = _try_lock_fd(fd)
+        if locked:
+            os.ftruncate(fd, 0)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, our_pid.encode())
+            _pid_lock_fd = fd
+            return True
+        os.close(fd)
+        if locked is False:
+            return False  # Another monitor holds the lock
+
+    # No OS locking: attempt atomic exclusive creation first
     try:
         fd = os.open(pid_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
         os.write(fd, our_pid.encode())
@@ -260,9 +398,8 @@ def acquire_pid_lock(cwd):
         return False
 
 
-def release_pid_lock(cwd):
-    """Release PID file lock."""
-    pid_file = _get_pid_file_path(cwd)
+def _remove_own_pid_file(pid_file):
+    """Remove pid_file if it holds this process's PID."""
     try:
         if os.path.exists(pid_file):
             with open(pid_file, "r") as f:
@@ -273,20 +410,54 @@ def release_pid_lock(cwd):
         pass
 
 
+def release_pid_lock(cwd):
+    """Release PID file lock.
+
+    On POSIX the PID file is removed while the lock is still held; once the
+    lock drops, a new monitor may lock and rewrite the same file, and removing
+    it then would let a third monitor start alongside that one. Windows can't
+    delete an open file, so there the lock is dropped first.
+    """
+    global _pid_lock_fd
+    pid_file = _get_pid_file_path(cwd)
+    remove_while_locked = _pid_lock_fd is not None and os.name != 'nt'
+    if remove_while_locked:
+        _remove_own_pid_file(pid_file)
+    if _pid_lock_fd is not None:
+        try:
+            os.close(_pid_lock_fd)
+        except OSError:
+            pass
+        _pid_lock_fd = None
+    if not remove_while_locked:
+        _remove_own_pid_file(pid_file)
+
+
 class SpeechMonitor:
     """Watch JSONL conversation logs and speak new assistant messages."""
 
-    def __init__(self, cwd=None, voice="en-US-GuyNeural", rate="+10%", debounce_ms=2000):
+    def __init__(self, cwd=None, voice="en-US-GuyNeural", rate="+10%", debounce_ms=2000,
+                 poll_interval=POLL_INTERVAL, rescan_interval=None):
         self.voice = voice
         self.rate = rate
         self.debounce_ms = debounce_ms
+        self.poll_interval = poll_interval
+        self.rescan_interval = rescan_interval  # None: depends on whether watchdog runs
         self.speech_queue = queue.Queue()
+        # Synthesized MP3 paths waiting to be played (None = stop)
+        self._play_queue = queue.Queue(maxsize=PLAY_AHEAD)
         self.running = True
-        # Bounded LRU dedup: OrderedDict keeps insertion order; evict oldest half at 2000
-        self._spoken_ids_max = 2000
+        # Bounded LRU dedup: OrderedDict in recency order; oldest dropped past the cap
+        self._spoken_ids_max = SPOKEN_IDS_MAX
         self.spoken_message_ids = collections.OrderedDict()
         self.temp_dir = tempfile.mkdtemp(prefix="claude_speak_")
-        self.file_counter = 0
+        # Fixed set of MP3 paths reused in turn instead of a new file per clip.
+        # Enough slots for a full play queue plus the clip playing and the one
+        # being synthesized, so a slot is never overwritten while in use.
+        self._mp3_slots = [
+            os.path.join(self.temp_dir, f"slot_{i}.mp3") for i in range(PLAY_AHEAD + 2)
+        ]
+        self._next_slot = 0
 
         # Scoped project directory (if cwd provided)
         self.project_jsonl_dir = None
@@ -301,17 +472,40 @@ class SpeechMonitor:
         # (derived from the JSONL file path, so per-project settings still work)
         self.active_config_dir = None
 
+        # Per-project pause flag and voice file, precomputed so the per-utterance
+        # checks don't rebuild them (None until a project is known)
+        self._paused_path = None
+        self._voice_path = None
+        if cwd:
+            self._set_config_dir(os.path.join(CLAUDE_PROJECTS_DIR, encode_cwd_to_dirname(cwd)))
+
         # Pending text accumulator for debounce
-        self.pending_text = ""
+        self.pending_chunks = []  # Joined with spaces when flushed
         self.last_text_time = 0
         self.pending_lock = threading.Lock()
+        # Set by add_text() so the debounce flusher only wakes when needed
+        self._text_added = threading.Event()
+
+        # Change notifier for the watched JSONL logs (None = poll)
+        self._notifier = None
+
+        # Open handle on the active log, its read offset and any trailing
+        # partial line not yet terminated by a newline
+        self._log_fh = None
+        self._log_path = None
+        self._log_pos = 0
+        self._log_partial = b""
+        # kqueue watching the open log (BSD/macOS without watchdog)
+        self._log_kq = None
 
         # Register atexit handler to clean temp dir even on unhandled crash
         atexit.register(self._cleanup_temp_dir)
 
-        # Start speech worker
+        # Start speech workers: synthesis of the next chunk overlaps playback
         self.speech_thread = threading.Thread(target=self._speech_worker, daemon=True)
         self.speech_thread.start()
+        self.play_thread = threading.Thread(target=self._play_worker, daemon=True)
+        self.play_thread.start()
 
         # Start debounce flusher
         self.debounce_thread = threading.Thread(target=self._debounce_flusher, daemon=True)
@@ -325,122 +519,164 @@ class SpeechMonitor:
         except Exception:
             pass
 
+    def _set_config_dir(self, config_dir):
+        """Point the per-project pause and voice lookups at config_dir."""
+        self._paused_path = os.path.join(config_dir, "speech-paused")
+        self._voice_path = os.path.join(config_dir, "speech-voice")
+
     def _is_paused(self):
         """Check if speech is paused, using active project config in global mode."""
-        # Per-project check (scoped mode)
-        if self.cwd:
-            return is_speech_paused(self.cwd)
-        # Global mode: check the active project's config dir directly
-        if self.active_config_dir:
-            if os.path.exists(os.path.join(self.active_config_dir, "speech-paused")):
-                return True
+        # Per-project check (the scoped project, or the active one in global mode)
+        if self._paused_path and os.path.exists(self._paused_path):
+            return True
         # Fall back to global pause flag
-        global_flag = os.path.join(os.path.expanduser("~"), ".claude", "speech-paused")
-        return os.path.exists(global_flag)
+        return os.path.exists(GLOBAL_PAUSE_FLAG)
 
     def _get_voice(self):
         """Get voice override, using active project config in global mode."""
-        # Per-project check (scoped mode)
-        if self.cwd:
-            return get_voice_override(self.cwd)
-        # Global mode: check the active project's config dir directly
-        if self.active_config_dir:
-            voice_file = os.path.join(self.active_config_dir, "speech-voice")
-            if os.path.exists(voice_file):
-                try:
-                    with open(voice_file, "r") as f:
-                        voice = f.read().strip()
-                        if voice:
-                            return voice
-                except OSError:
-                    pass
+        # Per-project check (the scoped project, or the active one in global mode)
+        if self._voice_path:
+            voice = _read_config_file(self._voice_path)
+            if voice:
+                return voice
         # Fall back to global voice
-        global_voice = os.path.join(os.path.expanduser("~"), ".claude", "speech-voice")
-        if os.path.exists(global_voice):
-            try:
-                with open(global_voice, "r") as f:
-                    voice = f.read().strip()
-                    if voice:
-                        return voice
-            except OSError:
-                pass
-        return None
+        return _read_config_file(GLOBAL_VOICE_FILE) or None
 
     def _speech_worker(self):
-        """Background worker that generates and plays speech."""
-        while self.running or not self.speech_queue.empty():
-            try:
-                text = self.speech_queue.get(timeout=0.5)
-                if text is None:
-                    break
+        """Background worker that synthesizes speech and hands it to the player.
 
-                # Skip speaking if paused (per-project or global)
-                if self._is_paused():
-                    self.speech_queue.task_done()
-                    continue
-
-                cleaned = cc_speak.clean_text(text, skip_code=True, skip_paths=True)
-                if not cleaned.strip() or len(cleaned.split()) < 3:
-                    self.speech_queue.task_done()
-                    continue
+        Blocks on the queue until stop() sends the None sentinel.
+        """
+        while True:
+            text = self.speech_queue.get()
+            if text is None:
+                break
+
+            # Skip speaking if paused (per-project or global). Everything else
+            # already queued is dropped with it, without a pause check per item.
+            if self._is_paused():
+                self.speech_queue.task_done()
+                if self._drop_queued_text():
+                    break
+                continue
 
-                self.file_counter += 1
-                output_path = os.path.join(self.temp_dir, f"speech_{self.file_counter}.mp3")
+            cleaned = cc_speak.clean_text(text, skip_code=True, skip_paths=True)
+            if not cleaned.strip() or len(cleaned.split()) < 3:
+                self.speech_queue.task_done()
+                continue
 
-                try:
-                    # Check for voice override (allows runtime voice changes)
-                    voice = self._get_voice() or self.voice
-                    cc_speak.tts_edge(cleaned, voice, self.rate, output_path)
-                    if os.path.exists(output_path):
-                        cc_speak.play_audio(output_path)
-                        os.remove(output_path)
-                except Exception:
-                    logger.error("Speech worker error", exc_info=True)
+            output_path = self._mp3_slots[self._next_slot]
+            self._next_slot = (self._next_slot + 1) % len(self._mp3_slots)
 
-                self.speech_queue.task_done()
+            try:
+                # Check for voice override (allows runtime voice changes)
+                voice = self._get_voice() or self.voice
+                # The slot may hold an older clip, so trust the return value
+                # rather than the file's existence
+                if cc_speak.tts_edge(cleaned, voice, self.rate, output_path):
+                    self._play_queue.put(output_path)
+            except Exception:
+                logger.error("Speech worker error", exc_info=True)
+
+            self.speech_queue.task_done()
+        self._play_queue.put(None)
+
+    def _drop_queued_text(self):
+        """Discard all queued text. Returns True if the stop sentinel was reached."""
+        while True:
+            try:
+                text = self.speech_queue.get_nowait()
             except queue.Empty:
-                continue
+                return False
+            if text is None:
+                return True
+            self.speech_queue.task_done()
+
+    def _play_worker(self):
+        """Background worker that plays synthesized clips in order."""
+        while True:
+            output_path = self._play_queue.get()
+            if output_path is None:
+                break
+            try:
+                # Pausing also silences clips synthesized before the pause
+                if not self._is_paused():
+                    cc_speak.play_audio(output_path)
+            except Exception:
+                logger.error("Playback error", exc_info=True)
+            # The file stays in its slot; the next clip there overwrites it
 
     def _debounce_flusher(self):
-        """Flush accumulated text after debounce period."""
+        """Flush accumulated text after debounce period.
+
+        Sleeps until add_text() signals new text, then until the debounce
+        period since the last addition has passed.
+        """
         while self.running:
-            time.sleep(0.1)
+            timeout = None
             with self.pending_lock:
-                if self.pending_text and self.last_text_time > 0:
+                if self.pending_chunks and self.last_text_time > 0:
                     elapsed = (time.time() - self.last_text_time) * 1000
                     if elapsed > self.debounce_ms:
-                        text = self.pending_text
-                        self.pending_text = ""
-                        self.last_text_time = 0
-                        chunks = cc_speak.extract_speakable_chunks(text)
-                        for chunk in chunks:
-                            self.speech_queue.put(chunk)
+                        self._flush_pending()
+                    else:
+                        timeout = (self.debounce_ms - elapsed) / 1000 + 0.01
+            self._text_added.wait(timeout)
+            self._text_added.clear()
+
+    def _flush_pending(self):
+        """Queue all pending text for speech. Caller holds pending_lock."""
+        text = " ".join(self.pending_chunks)
+        self.pending_chunks.clear()
+        self.last_text_time = 0
+        for chunk in cc_speak.stream_chunks(text):
+            self.speech_queue.put(chunk)
 
     def _record_spoken_id(self, message_id):
         """Record a message_id in the bounded LRU dedup set.
 
-        Evicts the oldest half when the set exceeds _spoken_ids_max entries.
+        Evicts the least recently seen ID once the set exceeds _spoken_ids_max.
         """
         self.spoken_message_ids[message_id] = True
         if len(self.spoken_message_ids) > self._spoken_ids_max:
-            # Evict oldest half
-            to_remove = self._spoken_ids_max // 2
-            for _ in range(to_remove):
-                self.spoken_message_ids.popitem(last=False)
+            self.spoken_message_ids.popitem(last=False)
 
     def add_text(self, text, message_id=None):
-        """Add text to be spoken (with deduplication by message.id)."""
+        """Add text to be spoken (with deduplication by message.id).
+
+        Log lines carry whole messages, so every chunk but the last is
+        complete and is queued right away; only the last waits out the
+        debounce period, in case more text follows.
+        """
         if message_id:
             if message_id in self.spoken_message_ids:
+                self.spoken_message_ids.move_to_end(message_id)
                 return
             self._record_spoken_id(message_id)
 
+        chunks = cc_speak.extract_speakable_chunks(text)
+        if not chunks:
+            return
+
         with self.pending_lock:
-            self.pending_text += " " + text
+            if len(chunks) > 1:
+                # Earlier pending text goes out first to keep the order
+                self._flush_pending()
+                for chunk in chunks[:-1]:
+                    self.speech_queue.put(chunk)
+            self.pending_chunks.append(chunks[-1])
             self.last_text_time = time.time()
+        self._text_added.set()
 
     def _find_jsonl(self):
         """Find the right JSONL file based on scope."""
+        # The notifier already knows which log was written last; only scan
+        # directories without one or once that file is gone
+        if self._notifier is not None and self._notifier.last_path:
+            if os.path.isfile(self._notifier.last_path):
+                return self._notifier.last_path
+            self._notifier.last_path = None
+
         # If scoped to a project, only look there
         if self.cwd:
             if not self.project_jsonl_dir:
@@ -453,36 +689,124 @@ class SpeechMonitor:
         # Global mode: find across all projects
         return find_active_jsonl_global()
 
-    @staticmethod
-    def _get_file_identity(filepath):
-        """Get a file identity marker to detect replacement vs truncation.
+    def _log_replaced(self, st):
+        """Return True if the open log handle is no longer the file stat'ed as st.
 
-        On Unix, uses inode number. On Windows, uses mtime as a proxy since
-        inodes are not reliably available.
+        Compares (st_dev, st_ino) of the handle and the path, which os.stat
+        fills in on Windows too, so appends (which change mtime) don't count
+        as a replacement.
         """
-        try:
-            st = os.stat(filepath)
-            if os.name == 'nt':
-                return st.st_mtime
-            else:
-                return st.st_ino
-        except OSError:
+        if self._log_fh is None:
+            return False
+        return not os.path.samestat(os.fstat(self._log_fh.fileno()), st)
+
+    def _start_notifier(self):
+        """Start a change notifier for the JSONL logs in scope, or return None.
+
+        Returns None when watchdog is missing or the directory doesn't exist
+        yet; watch() then polls and tries again on the next pass.
+        """
+        if self.cwd:
+            if not self.project_jsonl_dir:
+                return None
+            return cc_speak.start_change_notifier(self.project_jsonl_dir, suffix=".jsonl")
+        if not os.path.isdir(CLAUDE_PROJECTS_DIR):
             return None
+        # Session logs sit directly in <projects>/<dir>/; deeper ones (e.g.
+        # subagent transcripts) aren't spoken and must not become the
+        # active log, or the project's pause/voice files would be missed
+        return cc_speak.start_change_notifier(CLAUDE_PROJECTS_DIR, recursive=True,
+                                              suffix=".jsonl", max_depth=1)
+
+    def _sleep(self, seconds):
+        """Sleep up to seconds, waking early when a JSONL log changes."""
+        if self._notifier is not None:
+            self._notifier.wait(seconds)
+        elif self._log_kq is not None:
+            self._log_kq.control(None, 1, seconds)
+        else:
+            time.sleep(seconds)
+
+    def _open_log(self, path):
+        """Open path as the active log, replacing any previous handle.
+
+        Without watchdog on BSD/macOS, the handle is also registered with
+        kqueue so waits wake as soon as the log is written.
+        """
+        self._close_log()
+        self._log_fh = open(path, "rb", buffering=0)
+        self._log_path = path
+        self._log_pos = -1
+        if self._notifier is None and hasattr(select, "kqueue"):
+            try:
+                kq = select.kqueue()
+                kq.control([select.kevent(
+                    self._log_fh.fileno(),
+                    filter=select.KQ_FILTER_VNODE,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                    fflags=(select.KQ_NOTE_EXTEND | select.KQ_NOTE_WRITE
+                            | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME),
+                )], 0)
+                self._log_kq = kq
+            except OSError:
+                pass
+
+    def _read_new_lines(self, path, pos):
+        """Read the complete lines appended to path since byte offset pos.
+
+        Keeps the log open between calls, so a read of new content is a single
+        read() on the handle. A trailing partial line is held back until the
+        rest of it is written. Returns (lines, new_pos); lines are undecoded.
+        """
+        if self._log_fh is None or self._log_path != path:
+            self._open_log(path)
+        if self._log_pos != pos:
+            self._log_fh.seek(pos)
+            self._log_partial = b""
+        data = self._log_fh.read()
+        self._log_pos = pos + len(data)
+        lines = (self._log_partial + data).split(b"\n")
+        self._log_partial = lines.pop()
+        return lines, self._log_pos
+
+    def _close_log(self):
+        """Close the handle on the active log, if any."""
+        if self._log_kq is not None:
+            self._log_kq.close()
+            self._log_kq = None
+        if self._log_fh is not None:
+            try:
+                self._log_fh.close()
+            except OSError:
+                pass
+        self._log_fh = None
+        self._log_path = None
+        self._log_partial = b""
 
     def watch(self):
         """Main watch loop - monitor JSONL files for new content."""
         current_file = None
         current_file_norm = None  # Normalized path for comparison
         file_pos = 0
-        file_identity = None  # inode (Unix) or mtime (Windows) to detect file replacement
         last_rescan_time = 0
-        rescan_interval = 5
 
         while self.running:
+            # Without watchdog this stays None and the loop polls
+            if self._notifier is None:
+                self._notifier = self._start_notifier()
+
             now = time.time()
 
-            # Periodically rescan for new/different active file
-            if now - last_rescan_time > rescan_interval or current_file is None:
+            # Periodically rescan for new/different active file, or right away
+            # when the notifier saw a different log being written
+            written = self._notifier.last_path if self._notifier is not None else None
+            rescan_interval = self.rescan_interval
+            if rescan_interval is None:
+                rescan_interval = RESCAN_INTERVAL if self._notifier is not None else POLL_RESCAN_INTERVAL
+            rescan_due = (rescan_interval > 0
+                          and now - last_rescan_time > rescan_interval)
+            if (rescan_due or current_file is None
+                    or (written and _normalize_path(written) != current_file_norm)):
                 last_rescan_time = now
                 latest = self._find_jsonl()
                 latest_norm = _normalize_path(latest)
@@ -492,49 +816,51 @@ class SpeechMonitor:
                     current_file_norm = latest_norm
                     # Track active project config dir (for per-project settings in global mode)
                     self.active_config_dir = os.path.dirname(latest)
+                    if not self.cwd:
+                        self._set_config_dir(self.active_config_dir)
                     try:
                         file_pos = os.path.getsize(current_file)
-                        file_identity = self._get_file_identity(current_file)
+                        self._open_log(current_file)
                     except OSError:
                         # Can't access new file yet — skip it, retry next cycle
                         current_file = None
                         current_file_norm = None
-                        file_identity = None
-                    time.sleep(0.5)
+                    self._sleep(self.poll_interval)
                     continue
 
             if not current_file:
-                time.sleep(1)
+                self._sleep(max(self.poll_interval, 1))
                 continue
 
             # Fix 6: If current file no longer exists, force immediate rescan
             if not os.path.exists(current_file):
                 logger.warning("Tracked JSONL file no longer exists, forcing rescan: %s", current_file)
+                self._close_log()
                 current_file = None
                 current_file_norm = None
-                file_identity = None
                 last_rescan_time = 0  # Force immediate rescan
                 continue
 
             # Check for new content (fast - just stat + read)
             try:
-                current_size = os.path.getsize(current_file)
+                st = os.stat(current_file)
+                current_size = st.st_size
 
-                # Fix 5: Detect file replacement (different inode/mtime means new file at same path)
-                new_identity = self._get_file_identity(current_file)
-                if file_identity is not None and new_identity != file_identity:
+                # Fix 5: Detect file replacement (the open handle and the path
+                # are different files) and re-read the new file from the start
+                if self._log_replaced(st):
                     logger.info("File replaced (identity changed), re-reading from start: %s", current_file)
+                    self._close_log()
                     file_pos = 0
-                    file_identity = new_identity
 
                 if current_size > file_pos:
-                    with open(current_file, "r", encoding="utf-8") as f:
-                        f.seek(file_pos)
-                        new_content = f.read()
-                        file_pos = f.tell()
-
-                    for line in new_content.strip().split("\n"):
-                        line = line.strip()
+                    lines, file_pos = self._read_new_lines(current_file, file_pos)
+                    for raw_line in lines:
+                        # Same early reject as extract_text_from_line, done on
+                        # the raw bytes so skipped lines are never decoded
+                        if b'"assistant"' not in raw_line:
+                            continue
+                        line = raw_line.decode("utf-8", errors="replace").strip()
                         if not line:
                             continue
                         text, msg_id = extract_text_from_line(line)
@@ -548,21 +874,27 @@ class SpeechMonitor:
             except (OSError, IOError):
                 pass  # Transient error — keep current file_pos, retry next cycle
 
-            time.sleep(0.5)
+            if self._notifier is None and self._log_kq is None:
+                time.sleep(self.poll_interval)
+            else:
+                self._sleep(cc_speak.NOTIFY_MAX_WAIT)
 
     def stop(self):
         """Stop the monitor and flush remaining text."""
         self.running = False
+        self._text_added.set()  # Let the debounce flusher exit
 
         with self.pending_lock:
-            if self.pending_text.strip():
-                chunks = cc_speak.extract_speakable_chunks(self.pending_text)
-                for chunk in chunks:
-                    self.speech_queue.put(chunk)
-                self.pending_text = ""
+            self._flush_pending()
+
+        if self._notifier is not None:
+            self._notifier.stop()
+            self._notifier = None
+        self._close_log()
 
         self.speech_queue.put(None)
         self.speech_thread.join(timeout=15)
+        self.play_thread.join(timeout=15)
 
         self._cleanup_temp_dir()
 
@@ -574,6 +906,11 @@ def main():
     parser.add_argument("--voice", "-v", default="en-US-GuyNeural", help="TTS voice")
     parser.add_argument("--rate", "-r", default="+10%", help="Speech rate")
     parser.add_argument("--debounce", "-d", type=int, default=2000, help="Debounce ms before speaking")
+    parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL,
+                        help="Seconds between log checks when watchdog is not installed")
+    parser.add_argument("--rescan-interval", type=float, default=None,
+                        help=f"Seconds between rescans for the active log, 0 to disable "
+                             f"(default: {RESCAN_INTERVAL} with watchdog, {POLL_RESCAN_INTERVAL} without)")
 
     args = parser.parse_args()
 
@@ -590,7 +927,9 @@ def main():
         cwd=args.cwd,
         voice=args.voice,
         rate=args.rate,
-        debounce_ms=args.debounce
+        debounce_ms=args.debounce,
+        poll_interval=args.poll_interval,
+        rescan_interval=args.rescan_interval,
     )
 
     def signal_handler(sig, frame):
@@ -13,10 +13,15 @@ Usage:
 
 import asyncio
 import base64
+import concurrent.futures
+import functools
+import gzip
 import hashlib
 import http.server
 import json
+import mmap
 import os
+import queue
 import secrets
 import shutil
 import signal
@@ -30,6 +35,14 @@ import webbrowser
 from pathlib import Path
 from urllib.parse import parse_qs, unquote, urlparse
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads  # optional: pip install orjson
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
 # Import cc-speak's TTS functionality
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from importlib.util import spec_from_file_location, module_from_spec
@@ -43,13 +56,86 @@ CLAUDE_PROJECTS_DIR = os.path.join(os.path.expanduser("~"), ".claude", "projects
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PREVIEW_DIR = os.path.join(tempfile.gettempdir(), "claude_speak_previews")
 
+# Synthesized previews persist here across restarts and are hardlinked into
+# PREVIEW_DIR for serving; least recently used clips are trimmed past the cap
+TTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".claude", "tts-cache")
+TTS_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# settings.html is kept in memory both raw and gzipped, with an ETag for
+# revalidation; it's reloaded only when the file's mtime or size changes
+SETTINGS_HTML = os.path.join(SCRIPT_DIR, 'settings.html')
+_html_cache = {'key': None, 'raw': b'', 'gz': b'', 'etag': ''}
+_html_lock = threading.Lock()
+
+# Largest POST body accepted; every API payload is a few hundred bytes
+MAX_BODY = 64 * 1024
+
+# The edge-tts voice catalog rarely changes and fetching it is a round trip to
+# Microsoft, so the serialized list is cached in memory and on disk for this
+# many seconds. The file lives in the user's own TTS cache, not the shared
+# temp dir, where another local user could plant its contents
+VOICES_CACHE_TTL = 3600
+VOICES_CACHE_FILE = os.path.join(TTS_CACHE_DIR, "voices.json")
+_voices_cache = {'body': None, 'ts': 0.0}
+_voices_lock = threading.Lock()
+
+# /api/status probes monitor PID files on this pool rather than one by one
+STATUS_CHECK_WORKERS = 16
+_status_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=STATUS_CHECK_WORKERS, thread_name_prefix='status-check')
+
+# Linux exposes live processes as /proc/<pid>, so liveness is a single stat()
+_HAS_PROCFS = sys.platform.startswith('linux') and os.path.isdir('/proc/self')
+
+# Liveness results are reused for this many seconds so a UI polling
+# /api/status doesn't re-probe every monitor on each tick
+PID_CHECK_TTL = 2.0
+_pid_alive_cache = {}
+_pid_alive_lock = threading.Lock()
+
+# /api/status/stream pushes a new snapshot when a PID file changes, and also
+# re-checks this often to catch monitors that died without removing theirs
+STATUS_STREAM_INTERVAL = 10
+_status_generation = 0
+_status_changed = threading.Condition()
+
+# edge-tts calls run on one long-lived event loop on a daemon thread instead
+# of building and tearing down a loop per request with asyncio.run()
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+# Seconds to wait for the edge-tts voice list before giving up
+VOICES_FETCH_TIMEOUT = 30
+
+# Seconds to wait for a preview clip to be synthesized
+PREVIEW_TIMEOUT = 60
+
+# Cache paths of clips being synthesized right now; concurrent requests for
+# the same clip wait on the first one's Event instead of synthesizing again
+_preview_inflight = {}
+_preview_inflight_lock = threading.Lock()
+
+# Previews synthesized at once; edge-tts throttles beyond a few connections,
+# and extra requests wait here rather than piling onto the service
+PREVIEW_CONCURRENCY = 2
+_preview_slots = threading.BoundedSemaphore(PREVIEW_CONCURRENCY)
+
+# Connection handler threads. Keep-alive connections and status streams each
+# hold one for their lifetime, so this leaves room for a few open tabs while
+# still capping a flood of requests
+MAX_HANDLER_THREADS = 32
+
+
+# Path separators and drive colons all become '-' (one str.translate pass)
+_DIRNAME_SEPARATORS = str.maketrans({':': '-', '\\': '-', '/': '-'})
+
 
 def encode_cwd_to_dirname(cwd):
     """Encode a working directory path to Claude's project directory name."""
-    path = os.path.normpath(cwd)
-    return path.replace(":", "-").replace("\\", "-").replace("/", "-")
+    return os.path.normpath(cwd).translate(_DIRNAME_SEPARATORS)
 
 
+@functools.lru_cache(maxsize=1024)
 def decode_dirname(dirname):
     """Best-effort decode of dirname back to a readable path.
 
@@ -77,9 +163,153 @@ def decode_dirname(dirname):
         # Find drive letter pattern: single letter followed by empty string (from ::)
         if len(parts) >= 3 and len(parts[0]) == 1 and parts[0].isalpha() and parts[1] == '':
             drive = parts[0] + ':\\'
-            rest = '\\'.join(p for p in parts[2:] if p)
-            return drive + rest
-    return '/' + '/'.join(p for p in dirname.split('-') if p)
+            return drive + '\\'.join(filter(None, parts[2:]))
+    return '/' + '/'.join(filter(None, dirname.split('-')))
+
+
+def _get_event_loop():
+    """Return the shared background event loop, starting it on first use."""
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='asyncio', daemon=True).start()
+            _event_loop = loop
+        return _event_loop
+
+
+def run_async(coro, timeout=None):
+    """Run a coroutine on the shared event loop and block for its result."""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_event_loop())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+def load_settings_html():
+    """Return (raw, gzipped, etag) for settings.html; raises OSError if missing."""
+    st = os.stat(SETTINGS_HTML)
+    key = (st.st_mtime_ns, st.st_size)
+    with _html_lock:
+        if _html_cache['key'] != key:
+            with open(SETTINGS_HTML, 'rb') as f:
+                raw = f.read()
+            _html_cache.update(
+                key=key,
+                raw=raw,
+                gz=gzip.compress(raw, 6),
+                etag='"%s"' % hashlib.blake2b(raw, digest_size=8).hexdigest(),
+            )
+        return _html_cache['raw'], _html_cache['gz'], _html_cache['etag']
+
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, copying instead where links aren't possible."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        pass
+    except OSError:
+        # Different filesystem, or one without hardlinks
+        shutil.copyfile(src, dst)
+
+
+def synthesize_preview(text, voice, rate, cache_path):
+    """Synthesize a clip into cache_path; raises if edge-tts fails outright.
+
+    The clip is written beside cache_path and renamed into place, so a
+    failed or partial clip never becomes a cache hit. Concurrent calls for
+    the same path share a single synthesis.
+    """
+    with _preview_inflight_lock:
+        done = _preview_inflight.get(cache_path)
+        if done is None:
+            _preview_inflight[cache_path] = threading.Event()
+    if done is not None:
+        done.wait(PREVIEW_TIMEOUT)
+        return
+
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        with _preview_slots:
+            result = run_async(cc_speak.tts_edge_async(text, voice, rate, tmp_path), PREVIEW_TIMEOUT)
+        if result and os.path.exists(tmp_path):
+            os.replace(tmp_path, cache_path)
+    finally:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        with _preview_inflight_lock:
+            _preview_inflight.pop(cache_path).set()
+
+
+def trim_tts_cache(max_bytes=TTS_CACHE_MAX_BYTES):
+    """Delete the least recently used clips until TTS_CACHE_DIR fits max_bytes."""
+    entries = []
+    try:
+        with os.scandir(TTS_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith('.mp3'):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def get_voices_json():
+    """Return the edge-tts voice list as JSON bytes, fetching it only when stale.
+
+    Raises ImportError if edge-tts is missing, or whatever the fetch raises.
+    """
+    with _voices_lock:
+        now = time.time()
+        if _voices_cache['body'] is not None and now - _voices_cache['ts'] < VOICES_CACHE_TTL:
+            return _voices_cache['body']
+
+        try:
+            mtime = os.path.getmtime(VOICES_CACHE_FILE)
+            if now - mtime < VOICES_CACHE_TTL:
+                with open(VOICES_CACHE_FILE, 'rb') as f:
+                    body = f.read()
+                if body:
+                    _voices_cache.update(body=body, ts=mtime)
+                    return body
+        except OSError:
+            pass
+
+        import edge_tts
+        body = _json_dumps(run_async(edge_tts.list_voices(), VOICES_FETCH_TIMEOUT))
+        _voices_cache.update(body=body, ts=now)
+
+        # Write-then-rename so a concurrent reader never sees a partial file
+        try:
+            os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{VOICES_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, VOICES_CACHE_FILE)
+        except OSError:
+            pass
+        return body
 
 
 def is_process_running(pid):
@@ -93,6 +323,10 @@ def is_process_running(pid):
                 kernel32.CloseHandle(handle)
                 return True
             return False
+        elif _HAS_PROCFS:
+            # Unlike kill(pid, 0) this isn't fooled by EPERM for processes
+            # owned by another user
+            return os.path.exists(f"/proc/{pid}")
         else:
             os.kill(pid, 0)
             return True
@@ -100,12 +334,199 @@ def is_process_running(pid):
         return False
 
 
+def is_process_running_cached(pid):
+    """is_process_running(), memoized for PID_CHECK_TTL seconds."""
+    now = time.monotonic()
+    with _pid_alive_lock:
+        hit = _pid_alive_cache.get(pid)
+    if hit is not None and now - hit[1] < PID_CHECK_TTL:
+        return hit[0]
+    running = is_process_running(pid)
+    with _pid_alive_lock:
+        if len(_pid_alive_cache) > 256:
+            _pid_alive_cache.clear()
+        _pid_alive_cache[pid] = (running, now)
+    return running
+
+
+def forget_process(pid):
+    """Drop a memoized liveness result, e.g. after signalling the process."""
+    with _pid_alive_lock:
+        _pid_alive_cache.pop(pid, None)
+
+
+def _reap(pid):
+    """Wait for a spawned child so it doesn't linger as a zombie."""
+    try:
+        os.waitpid(pid, 0)
+    except ChildProcessError:
+        pass
+
+
+def spawn_detached(cmd):
+    """Start cmd in a new session with output discarded (Unix); return its PID.
+
+    Uses posix_spawn where the platform supports it, which skips fork()'s
+    copy of this process's page tables. An exited child is reaped on a
+    daemon thread, because a zombie still passes the liveness check.
+    """
+    try:
+        pid = os.posix_spawn(cmd[0], cmd, os.environ, file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ], setsid=True)
+        threading.Thread(target=_reap, args=(pid,), daemon=True, name='reaper').start()
+    except (AttributeError, NotImplementedError):
+        # No posix_spawn, or no POSIX_SPAWN_SETSID (e.g. macOS before 10.15)
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+        pid = proc.pid
+        threading.Thread(target=proc.wait, daemon=True, name='reaper').start()
+    return pid
+
+
+def check_pid_file(pid_file):
+    """Read a monitor PID file and probe its process.
+
+    Returns (pid, running), or None if the file is missing or unreadable.
+    Removes the PID file if the process has exited.
+    """
+    try:
+        with open(pid_file, 'r') as f:
+            pid = int(f.read().strip())
+    except (ValueError, OSError):
+        return None
+    running = is_process_running_cached(pid)
+    # Clean up stale PID file if process is no longer running
+    if not running:
+        try:
+            os.remove(pid_file)
+        except OSError:
+            pass
+    return pid, running
+
+
+def collect_status():
+    """Return {'monitors': [...]} for the global and per-project monitors.
+
+    Verifies each PID is actually running and cleans up stale PID files
+    where the process has exited.
+    """
+    # Global monitor first, then one candidate per project directory
+    dirnames = [None]
+    pid_files = [os.path.join(os.path.expanduser("~"), ".claude", "speech-monitor.pid")]
+    try:
+        with os.scandir(CLAUDE_PROJECTS_DIR) as it:
+            for entry in it:
+                dirnames.append(entry.name)
+                pid_files.append(os.path.join(entry.path, 'speech-monitor.pid'))
+    except OSError:
+        pass
+
+    monitors = []
+    results = _status_executor.map(check_pid_file, pid_files)
+    for dirname, result in zip(dirnames, results):
+        if result is None:
+            continue
+        pid, running = result
+        if dirname is None:
+            monitors.append({
+                'project': None,
+                'name': 'Global (all projects)',
+                'pid': pid,
+                'running': running,
+                'mode': 'global',
+            })
+        else:
+            project = decode_dirname(dirname)
+            monitors.append({
+                'project': project,
+                'name': os.path.basename(project.rstrip('/\\')),
+                'pid': pid,
+                'running': running,
+                'mode': 'project',
+            })
+
+    return {'monitors': monitors}
+
+
+def _watch_pid_files(notifier):
+    """Bump the status generation whenever the notifier reports a change."""
+    global _status_generation
+    while True:
+        notifier.wait()
+        with _status_changed:
+            _status_generation += 1
+            _status_changed.notify_all()
+
+
+def start_status_watchers():
+    """Watch monitor PID files so status streams update without polling.
+
+    Needs watchdog; without it, streams fall back to re-checking every
+    STATUS_STREAM_INTERVAL seconds.
+    """
+    watches = [
+        (os.path.join(os.path.expanduser("~"), ".claude"), False),
+        (CLAUDE_PROJECTS_DIR, True),
+    ]
+    for directory, recursive in watches:
+        notifier = cc_speak.start_change_notifier(directory, recursive=recursive, suffix='speech-monitor.pid')
+        if notifier is not None:
+            threading.Thread(target=_watch_pid_files, args=(notifier,), daemon=True, name='status-watch').start()
+
+
+def wait_for_status_change(generation, timeout):
+    """Wait until the status generation moves past generation; return the current one."""
+    with _status_changed:
+        _status_changed.wait_for(lambda: _status_generation != generation, timeout)
+        return _status_generation
+
+
 class ConfigHandler(http.server.BaseHTTPRequestHandler):
     """HTTP request handler for the settings UI and API."""
 
     # CSRF token shared across all handler instances (set by the server)
     csrf_token = None
 
+    # Keep-alive: the page's burst of API calls reuses one connection (and
+    # one handler thread) instead of opening a new one per request
+    protocol_version = 'HTTP/1.1'
+
+    # Close idle keep-alive connections after this many seconds
+    timeout = 30
+
+    # Buffer response writes so headers and body leave in one send() rather
+    # than two. On a keep-alive connection the small second write otherwise
+    # waits on Nagle's algorithm and the client's delayed ACK (~40 ms).
+    # The handler flushes after each request.
+    wbufsize = 64 * 1024
+
+    # Exact-path GET routes taking no arguments (path -> method name);
+    # /api/settings reads its query string and /audio/ is a prefix match
+    _GET_ROUTES = {
+        '/': '_serve_html',
+        '/settings.html': '_serve_html',
+        '/api/voices': '_api_list_voices',
+        '/api/projects': '_api_list_projects',
+        '/api/status': '_api_get_status',
+        '/api/status/stream': '_api_status_stream',
+        '/api/csrf-token': '_api_csrf_token',
+    }
+
+    # POST routes (path -> method name); each takes the decoded JSON body
+    _POST_ROUTES = {
+        '/api/preview': '_api_preview',
+        '/api/settings': '_api_save_settings',
+        '/api/monitor/start': '_api_start_monitor',
+        '/api/monitor/stop': '_api_stop_monitor',
+    }
+
     def _check_origin(self):
         """Validate Origin header on POST requests to prevent CSRF attacks.
 
@@ -126,20 +547,13 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
     def do_GET(self):
         parsed = urlparse(self.path)
 
-        if parsed.path == '/' or parsed.path == '/settings.html':
-            self._serve_html()
-        elif parsed.path == '/api/voices':
-            self._api_list_voices()
-        elif parsed.path == '/api/projects':
-            self._api_list_projects()
+        route = self._GET_ROUTES.get(parsed.path)
+        if route is not None:
+            getattr(self, route)()
         elif parsed.path == '/api/settings':
             params = parse_qs(parsed.query)
             project = params.get('project', [None])[0]
             self._api_get_settings(project)
-        elif parsed.path == '/api/status':
-            self._api_get_status()
-        elif parsed.path == '/api/csrf-token':
-            self._api_csrf_token()
         elif parsed.path.startswith('/audio/'):
             self._serve_audio(parsed.path)
         else:
@@ -147,34 +561,44 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
 
     def do_POST(self):
         # CSRF protection: validate Origin header
+        # Any early return below leaves the request body unread, so the
+        # keep-alive connection can't be reused for another request
         if not self._check_origin():
+            self.close_connection = True
             self._json_response({'error': 'Forbidden: invalid Origin header'}, 403)
             return
 
         # CSRF protection: validate token (if client sends one)
         csrf_header = self.headers.get('X-CSRF-Token')
         if csrf_header is not None and csrf_header != self.csrf_token:
+            self.close_connection = True
             self._json_response({'error': 'Forbidden: invalid CSRF token'}, 403)
             return
 
         parsed = urlparse(self.path)
-        content_length = int(self.headers.get('Content-Length', 0))
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.close_connection = True
+            self._json_response({'error': 'Invalid Content-Length'}, 400)
+            return
+        if content_length > MAX_BODY:
+            self.close_connection = True
+            self._json_response({'error': 'Request body too large'}, 413)
+            return
         body = self.rfile.read(content_length) if content_length else b'{}'
 
         try:
-            data = json.loads(body)
-        except json.JSONDecodeError:
+            data = _json_loads(body)
+        except ValueError:
             self._json_response({'error': 'Invalid JSON'}, 400)
             return
 
-        if parsed.path == '/api/preview':
-            self._api_preview(data)
-        elif parsed.path == '/api/settings':
-            self._api_save_settings(data)
-        elif parsed.path == '/api/monitor/start':
-            self._api_start_monitor(data)
-        elif parsed.path == '/api/monitor/stop':
-            self._api_stop_monitor(data)
+        route = self._POST_ROUTES.get(parsed.path)
+        if route is not None:
+            getattr(self, route)(data)
         else:
             self.send_error(404)
 
@@ -184,23 +608,40 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, X-CSRF-Token')
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     # ─── Page Serving ────────────────────────────────────────────────────────
 
     def _serve_html(self):
         """Serve the settings.html page."""
-        html_path = os.path.join(SCRIPT_DIR, 'settings.html')
         try:
-            with open(html_path, 'rb') as f:
-                content = f.read()
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html; charset=utf-8')
-            self.send_header('Content-Length', len(content))
-            self.end_headers()
-            self.wfile.write(content)
-        except FileNotFoundError:
+            raw, gz, etag = load_settings_html()
+        except OSError:
             self.send_error(404, 'settings.html not found')
+            return
+
+        if_none_match = self.headers.get('If-None-Match', '')
+        if if_none_match == '*' or etag in if_none_match:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            content = gz
+        else:
+            content = raw
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', len(content))
+        if content is gz:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(content)
 
     def _serve_audio(self, path):
         """Serve a generated audio preview file."""
@@ -218,17 +659,28 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
             self.send_error(403)
             return
 
-        if os.path.exists(audio_path):
-            with open(audio_path, 'rb') as f:
-                content = f.read()
+        try:
+            f = open(audio_path, 'rb')
+        except OSError:
+            self.send_error(404)
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
             self.send_response(200)
             self.send_header('Content-Type', 'audio/mpeg')
-            self.send_header('Content-Length', len(content))
+            self.send_header('Content-Length', size)
             self.send_header('Cache-Control', 'public, max-age=3600')
             self.end_headers()
-            self.wfile.write(content)
-        else:
-            self.send_error(404)
+            if hasattr(os, 'sendfile') or not size:
+                # Zero-copy from the page cache where the OS supports sendfile()
+                self.wfile.flush()
+                self.connection.sendfile(f)
+            else:
+                # No sendfile() (Windows): send straight from a read-only
+                # mapping instead of socket.sendfile's read/send loop, which
+                # copies the file into a fresh bytes object per chunk
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    self.wfile.write(mm)
 
     # ─── API Endpoints ───────────────────────────────────────────────────────
 
@@ -239,9 +691,7 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
     def _api_list_voices(self):
         """GET /api/voices - List all available edge-tts voices."""
         try:
-            import edge_tts
-            voices = asyncio.run(edge_tts.list_voices())
-            self._json_response(voices)
+            self._send_json_bytes(get_voices_json())
         except ImportError:
             self._json_response({'error': 'edge-tts not installed. Run: pip install edge-tts'}, 500)
         except Exception as e:
@@ -254,46 +704,62 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
         cutoff = now - 86400  # 24 hours ago
 
         projects = []
-        if os.path.exists(CLAUDE_PROJECTS_DIR):
-            for dirname in os.listdir(CLAUDE_PROJECTS_DIR):
-                dirpath = os.path.join(CLAUDE_PROJECTS_DIR, dirname)
-                if not os.path.isdir(dirpath):
-                    continue
-
-                # Find the most recently modified JSONL file
-                jsonl_files = [
-                    os.path.join(dirpath, f) for f in os.listdir(dirpath)
-                    if f.endswith('.jsonl')
-                ]
-                if not jsonl_files:
-                    continue
+        try:
+            with os.scandir(CLAUDE_PROJECTS_DIR) as it:
+                project_entries = list(it)
+        except OSError:
+            project_entries = []
+
+        for project_entry in project_entries:
+            if not project_entry.is_dir():
+                continue
+            dirname = project_entry.name
+            dirpath = project_entry.path
+
+            # One scandir pass yields both the newest JSONL mtime and the
+            # names of the settings files, without a stat() per lookup.
+            # The directory's own mtime can't be used to prune: appending
+            # to an existing transcript doesn't touch it.
+            last_active = None
+            names = set()
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        names.add(entry.name)
+                        if entry.name.endswith('.jsonl'):
+                            try:
+                                mtime = entry.stat().st_mtime
+                            except OSError:
+                                continue
+                            if last_active is None or mtime > last_active:
+                                last_active = mtime
+            except OSError:
+                continue
 
-                last_active = max(os.path.getmtime(f) for f in jsonl_files)
+            # Only include projects active in the last 24 hours
+            if last_active is None or last_active < cutoff:
+                continue
 
-                # Only include projects active in the last 24 hours
-                if last_active < cutoff:
-                    continue
+            decoded_path = decode_dirname(dirname)
+            is_paused = 'speech-paused' in names
 
-                decoded_path = decode_dirname(dirname)
-                is_paused = os.path.exists(os.path.join(dirpath, 'speech-paused'))
+            voice = None
+            voice_file = os.path.join(dirpath, 'speech-voice')
+            if 'speech-voice' in names:
+                try:
+                    with open(voice_file, 'r') as f:
+                        voice = f.read().strip()
+                except OSError:
+                    pass
 
-                voice = None
-                voice_file = os.path.join(dirpath, 'speech-voice')
-                if os.path.exists(voice_file):
-                    try:
-                        with open(voice_file, 'r') as f:
-                            voice = f.read().strip()
-                    except OSError:
-                        pass
-
-                projects.append({
-                    'dirname': dirname,
-                    'path': decoded_path,
-                    'name': os.path.basename(decoded_path.rstrip('/\\')),
-                    'voice': voice,
-                    'paused': is_paused,
-                    'last_active': last_active,
-                })
+            projects.append({
+                'dirname': dirname,
+                'path': decoded_path,
+                'name': os.path.basename(decoded_path.rstrip('/\\')),
+                'voice': voice,
+                'paused': is_paused,
+                'last_active': last_active,
+            })
 
         # Sort by most recently active first
         projects.sort(key=lambda p: p['last_active'], reverse=True)
@@ -399,16 +865,30 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
         os.makedirs(PREVIEW_DIR, exist_ok=True)
 
         # Cache by content hash
-        cache_key = hashlib.md5(f"{text}|{voice}|{rate}".encode()).hexdigest()[:16]
+        cache_key = hashlib.blake2b(f"{text}|{voice}|{rate}".encode(), digest_size=8).hexdigest()
         filename = f"preview_{cache_key}.mp3"
         output_path = os.path.join(PREVIEW_DIR, filename)
 
         if not os.path.exists(output_path):
+            cache_path = os.path.join(TTS_CACHE_DIR, f"{cache_key}.mp3")
+            if not os.path.exists(cache_path):
+                # tts_edge_async exits the process when edge-tts is missing,
+                # which would take the shared event loop down with it
+                if cc_speak._EDGE_COMMUNICATE is None:
+                    self._json_response({'error': 'edge-tts not installed. Run: pip install edge-tts'}, 500)
+                    return
+                try:
+                    synthesize_preview(text, voice, rate, cache_path)
+                except Exception as e:
+                    self._json_response({'error': f'TTS generation failed: {e}'}, 500)
+                    return
             try:
-                cc_speak.tts_edge(text, voice, rate, output_path)
-            except Exception as e:
-                self._json_response({'error': f'TTS generation failed: {e}'}, 500)
-                return
+                # Bump the shared inode's mtime: it orders cache eviction and
+                # keeps the periodic preview sweep from reaping the new link
+                os.utime(cache_path)
+                link_or_copy(cache_path, output_path)
+            except OSError:
+                pass
 
         if not os.path.exists(output_path):
             self._json_response({'error': 'Audio file was not generated'}, 500)
@@ -417,62 +897,38 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
         self._json_response({'url': f'/audio/{filename}'})
 
     def _api_get_status(self):
-        """GET /api/status - Check running speech monitors.
+        """GET /api/status - Check running speech monitors."""
+        self._json_response(collect_status())
 
-        Verifies each PID is actually running and cleans up stale PID files
-        where the process has exited.
-        """
-        monitors = []
+    def _api_status_stream(self):
+        """GET /api/status/stream - Push monitor status as Server-Sent Events.
 
-        # Check global monitor PID
-        global_pid_file = os.path.join(os.path.expanduser("~"), ".claude", "speech-monitor.pid")
-        if os.path.exists(global_pid_file):
-            try:
-                with open(global_pid_file, 'r') as f:
-                    pid = int(f.read().strip())
-                running = is_process_running(pid)
-                # Clean up stale PID file if process is no longer running
-                if not running:
-                    try:
-                        os.remove(global_pid_file)
-                    except OSError:
-                        pass
-                monitors.append({
-                    'project': None,
-                    'name': 'Global (all projects)',
-                    'pid': pid,
-                    'running': running,
-                    'mode': 'global',
-                })
-            except (ValueError, OSError):
-                pass
+        Sends a snapshot up front and again whenever it changes; otherwise a
+        comment line every STATUS_STREAM_INTERVAL seconds keeps the
+        connection alive and notices when the client has gone.
+        """
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
 
-        # Check per-project monitor PIDs
-        if os.path.exists(CLAUDE_PROJECTS_DIR):
-            for dirname in os.listdir(CLAUDE_PROJECTS_DIR):
-                pid_file = os.path.join(CLAUDE_PROJECTS_DIR, dirname, 'speech-monitor.pid')
-                if os.path.exists(pid_file):
-                    try:
-                        with open(pid_file, 'r') as f:
-                            pid = int(f.read().strip())
-                        running = is_process_running(pid)
-                        # Clean up stale PID file if process is no longer running
-                        if not running:
-                            try:
-                                os.remove(pid_file)
-                            except OSError:
-                                pass
-                        monitors.append({
-                            'project': decode_dirname(dirname),
-                            'name': os.path.basename(decode_dirname(dirname).rstrip('/\\')),
-                            'pid': pid,
-                            'running': running,
-                            'mode': 'project',
-                        })
-                    except (ValueError, OSError):
-                        pass
-
-        self._json_response({'monitors': monitors})
+        generation = _status_generation
+        last = None
+        try:
+            while True:
+                snapshot = _json_dumps(collect_status())
+                if snapshot != last:
+                    self.wfile.write(b'data: ' + snapshot + b'\n\n')
+                    last = snapshot
+                else:
+                    self.wfile.write(b': keep-alive\n\n')
+                self.wfile.flush()
+                generation = wait_for_status_change(generation, STATUS_STREAM_INTERVAL)
+        except OSError:
+            # Client disconnected
+            pass
 
     def _api_start_monitor(self, data):
         """POST /api/monitor/start - Start a speech monitor process."""
@@ -501,19 +957,14 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
                     stderr=subprocess.DEVNULL,
                     close_fds=True,
                 )
+                pid = proc.pid
             else:
                 # Unix: start in new session
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    start_new_session=True,
-                    close_fds=True,
-                )
+                pid = spawn_detached(cmd)
 
             self._json_response({
                 'ok': True,
-                'pid': proc.pid,
+                'pid': pid,
                 'mode': 'project' if project else 'global',
             })
         except Exception as e:
@@ -545,6 +996,7 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
             # Clean up PID files that reference this PID
             # (atexit handler doesn't fire on forced termination)
             self._cleanup_pid_files(pid)
+            forget_process(pid)
 
             self._json_response({'ok': True})
         except (ProcessLookupError, PermissionError) as e:
@@ -579,11 +1031,16 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
 
     def _json_response(self, data, status=200):
         """Send a JSON response."""
-        content = json.dumps(data).encode()
+        self._send_json_bytes(_json_dumps(data), status)
+
+    def _send_json_bytes(self, content, status=200):
+        """Send an already-serialized JSON response."""
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Content-Length', len(content))
         self.send_header('Access-Control-Allow-Origin', '*')
+        if self.close_connection:
+            self.send_header('Connection', 'close')
         self.end_headers()
         self.wfile.write(content)
 
@@ -592,10 +1049,34 @@ class ConfigHandler(http.server.BaseHTTPRequestHandler):
         pass
 
 
-class ThreadedTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
-    """Allow concurrent requests (preview generation can be slow)."""
+class ThreadedTCPServer(socketserver.TCPServer):
+    """Serve connections concurrently on a fixed pool of handler threads.
+
+    Unlike ThreadingMixIn's thread per connection, a burst of requests
+    queues for a free worker instead of spawning threads without limit.
+    Workers are daemon threads so open status streams don't block exit.
+    """
     allow_reuse_address = True
-    daemon_threads = True
+
+    def __init__(self, server_address, handler_class, workers=MAX_HANDLER_THREADS):
+        super().__init__(server_address, handler_class)
+        self._pending = queue.Queue()
+        for i in range(workers):
+            threading.Thread(target=self._handler_worker, daemon=True, name=f'http-{i}').start()
+
+    def process_request(self, request, client_address):
+        """Hand the accepted connection to the worker pool."""
+        self._pending.put((request, client_address))
+
+    def _handler_worker(self):
+        while True:
+            request, client_address = self._pending.get()
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
 
 
 def cleanup_previews(max_age_seconds=None):
@@ -605,27 +1086,23 @@ def cleanup_previews(max_age_seconds=None):
         max_age_seconds: If provided, only delete files older than this many seconds.
                          If None, delete all preview files (used on startup/shutdown).
     """
-    if not os.path.exists(PREVIEW_DIR):
+    now = time.time()
+    try:
+        it = os.scandir(PREVIEW_DIR)
+    except OSError:
         return
-    if max_age_seconds is None:
-        # Full cleanup — remove entire directory
-        try:
-            shutil.rmtree(PREVIEW_DIR, ignore_errors=True)
-        except Exception:
-            pass
-    else:
-        # Selective cleanup — only remove files older than max_age_seconds
-        now = time.time()
-        try:
-            for filename in os.listdir(PREVIEW_DIR):
-                filepath = os.path.join(PREVIEW_DIR, filename)
-                try:
-                    if os.path.isfile(filepath) and (now - os.path.getmtime(filepath)) > max_age_seconds:
-                        os.remove(filepath)
-                except OSError:
-                    pass
-        except OSError:
-            pass
+    # The directory is flat, so a single scandir pass replaces rmtree's walk
+    # and reuses each entry's cached type and stat
+    with it:
+        for entry in it:
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if max_age_seconds is not None and now - entry.stat().st_mtime <= max_age_seconds:
+                    continue
+                os.unlink(entry.path)
+            except OSError:
+                pass
 
 
 def _periodic_preview_cleanup(stop_event, interval_seconds=600, max_age_seconds=3600):
@@ -640,6 +1117,26 @@ def _periodic_preview_cleanup(stop_event, interval_seconds=600, max_age_seconds=
         cleanup_previews(max_age_seconds=max_age_seconds)
 
 
+def _prewarm():
+    """Warm caches in the background so the first page load finds them hot.
+
+    Loads settings.html, starts the event loop, and fetches the voice list,
+    which also primes DNS and TLS for the first preview. Also trims the
+    persistent TTS cache.
+    """
+    trim_tts_cache()
+    try:
+        load_settings_html()
+        os.makedirs(PREVIEW_DIR, exist_ok=True)
+    except OSError:
+        pass
+    try:
+        get_voices_json()
+    except Exception:
+        # Offline or edge-tts missing; /api/voices reports the error itself
+        pass
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="claude-speak configuration server")
@@ -672,6 +1169,9 @@ def main():
     )
     cleanup_thread.start()
 
+    threading.Thread(target=_prewarm, daemon=True, name='prewarm').start()
+    start_status_watchers()
+
     url = f"http://localhost:{args.port}"
     print(f"claude-speak settings: {url}")
     print("Press Ctrl+C to stop\n")
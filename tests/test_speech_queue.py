@@ -0,0 +1,63 @@
+"""SpeechQueue plays batches back in enqueue order with several synth workers.
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import random
+import threading
+import time
+import unittest
+from importlib.util import module_from_spec, spec_from_file_location
+
+_CC_SPEAK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cc-speak.py")
+_spec = spec_from_file_location("cc_speak", _CC_SPEAK_PATH)
+cc_speak = module_from_spec(_spec)
+_spec.loader.exec_module(cc_speak)
+
+
+class SpeechQueueOrderTest(unittest.TestCase):
+
+    def test_playback_follows_enqueue_order_with_several_workers(self):
+        played = []
+        played_lock = threading.Lock()
+
+        def fake_play_audio(path, blocking=True, volume=100):
+            with played_lock:
+                played.extend(int(line.split(":")[0]) for line in path.split("\n"))
+
+        def fake_synthesize(texts, seq, loop):
+            # Uneven synthesis times let workers finish out of order
+            time.sleep(random.uniform(0, 0.02))
+            return ("\n".join(texts), "")
+
+        original_play_audio = cc_speak.play_audio
+        cc_speak.play_audio = fake_play_audio
+        try:
+            sq = cc_speak.SpeechQueue("edge", "voice", "+0%", 1.0, False, False, synth_workers=3)
+            sq._synthesize = fake_synthesize
+
+            # Stall every drain step so another worker can take an entry
+            # in between, as happens when a draining thread is preempted
+            get_nowait = sq.queue.get_nowait
+
+            def slow_get_nowait():
+                time.sleep(0.001)
+                return get_nowait()
+
+            sq.queue.get_nowait = slow_get_nowait
+            count = 60
+            for i in range(count):
+                # ~400-char chunks so each synthesis batch holds a few of them
+                sq.enqueue(f"{i}:" + "x" * 400)
+                if i % 8 == 7:
+                    time.sleep(0.05)
+            sq.stop()
+        finally:
+            cc_speak.play_audio = original_play_audio
+
+        self.assertEqual(played, list(range(count)))
+
+
+if __name__ == "__main__":
+    unittest.main()